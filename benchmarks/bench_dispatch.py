@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""统计 AutoHideWindow 每秒回调到 Python 的事件处理次数：空闲、拖动、滑动动画三种场景。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_dispatch [--seconds 2]
+"""
+import argparse
+import math
+import time
+from collections import Counter
+
+from benchmarks.common import qt_app, spin, spin_until
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QEvent, QPointF
+from PySide6.QtGui import QMouseEvent
+
+from components.ui_window import AutoHideWindow
+
+# AutoHideWindow 上所有会被 Qt 回调的 Python 方法（事件处理函数和事件过滤器）
+HANDLERS = sorted(
+    name
+    for name in vars(AutoHideWindow)
+    if name.endswith("Event") or name in ("event", "eventFilter")
+)
+
+
+def _counting(name):
+    original = getattr(AutoHideWindow, name)
+
+    def handler(self, *args):
+        self.dispatches[name] += 1
+        return original(self, *args)
+
+    return handler
+
+
+CountingWindow = type(
+    "CountingWindow",
+    (AutoHideWindow,),
+    {name: _counting(name) for name in HANDLERS},
+)
+
+
+def make_window(app):
+    window = CountingWindow()
+    window.dispatches = Counter()
+    window.resize(320, 220)
+    window.move(400, 300)
+    window.show()
+    app.processEvents()
+    window.dispatches.clear()
+    return window
+
+
+def scenario_idle(app, seconds):
+    window = make_window(app)
+    spin(app, seconds)
+    return window
+
+
+def scenario_drag(app, seconds, rate=250):
+    window = make_window(app)
+    start = QPointF(window.pos()) + QPointF(20, 10)
+
+    def send(kind, pos, buttons):
+        local = pos - QPointF(window.pos())
+        QApplication.sendEvent(
+            window, QMouseEvent(kind, local, pos, Qt.LeftButton, buttons, Qt.NoModifier)
+        )
+
+    send(QEvent.MouseButtonPress, start, Qt.LeftButton)
+    began = time.perf_counter()
+    i = 0
+    while time.perf_counter() - began < seconds:
+        angle = 2 * math.pi * i / rate
+        send(QEvent.MouseMove, start + QPointF(200 * math.cos(angle), 80 * math.sin(angle)), Qt.LeftButton)
+        spin(app, 1 / rate)
+        i += 1
+    send(QEvent.MouseButtonRelease, start, Qt.NoButton)
+    return window
+
+
+def scenario_animate(app, seconds):
+    window = make_window(app)
+    window.move(0, 300)
+    window.update_hidden_edge()
+    began = time.perf_counter()
+    while time.perf_counter() - began < seconds:
+        window.auto_hide_window()
+        spin_until(app, lambda: not window._is_animating)
+        window.show_full_window()
+        spin_until(app, lambda: not window._is_animating)
+    return window
+
+
+SCENARIOS = {
+    "idle": scenario_idle,
+    "drag": scenario_drag,
+    "animate": scenario_animate,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    app = qt_app()
+    print(f"python handlers: {', '.join(HANDLERS)}")
+    for name, scenario in SCENARIOS.items():
+        t0 = time.perf_counter()
+        window = scenario(app, args.seconds)
+        elapsed = time.perf_counter() - t0
+        total = sum(window.dispatches.values())
+        detail = ", ".join(
+            f"{handler}={count / elapsed:.0f}"
+            for handler, count in window.dispatches.most_common()
+        )
+        print(f"{name:8s} {total / elapsed:8.1f} dispatches/s  ({detail})")
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""合成拖动基准：统计每秒拖动产生的原生窗口移动次数与事件处理耗时。
+
+用法（在仓库根目录）：
+    python -m benchmarks.bench_drag [--seconds 1] [--rate 1000]
+"""
+import argparse
+import math
+import time
+
+from benchmarks.common import qt_app
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QEvent, QPointF
+from PySide6.QtGui import QMouseEvent
+
+from components.ui_window import AutoHideWindow
+
+
+class CountingWindow(AutoHideWindow):
+    def __init__(self):
+        super().__init__()
+        self.native_moves = 0
+        self.handler_time = 0.0
+
+    def mouseMoveEvent(self, event):
+        t0 = time.perf_counter()
+        super().mouseMoveEvent(event)
+        self.handler_time += time.perf_counter() - t0
+
+    def flush_drag(self):
+        t0 = time.perf_counter()
+        super().flush_drag()
+        self.handler_time += time.perf_counter() - t0
+
+    def moveEvent(self, event):
+        self.native_moves += 1
+        t0 = time.perf_counter()
+        super().moveEvent(event)
+        self.handler_time += time.perf_counter() - t0
+
+
+def mouse_event(kind, window, global_pos, buttons):
+    local = QPointF(global_pos - QPointF(window.pos()))
+    return QMouseEvent(kind, local, global_pos, Qt.LeftButton, buttons, Qt.NoModifier)
+
+
+def run(seconds, rate):
+    app = qt_app()
+    window = CountingWindow()
+    window.resize(320, 220)
+    window.move(400, 300)
+    window.show()
+    app.processEvents()
+
+    start = QPointF(window.pos()) + QPointF(20, 10)
+    QApplication.sendEvent(
+        window, mouse_event(QEvent.MouseButtonPress, window, start, Qt.LeftButton)
+    )
+    window.native_moves = 0
+    window.handler_time = 0.0
+
+    samples = int(seconds * rate)
+    began = time.perf_counter()
+    for i in range(samples):
+        # 在屏幕中部画圈，偶尔擦过左边缘以触发吸附
+        angle = 2 * math.pi * i / rate
+        pos = start + QPointF(380 * math.cos(angle), 120 * math.sin(angle))
+        QApplication.sendEvent(
+            window, mouse_event(QEvent.MouseMove, window, pos, Qt.LeftButton)
+        )
+        app.processEvents()
+        deadline = began + (i + 1) / rate
+        while time.perf_counter() < deadline:
+            app.processEvents()
+    QApplication.sendEvent(
+        window, mouse_event(QEvent.MouseButtonRelease, window, pos, Qt.NoButton)
+    )
+    elapsed = time.perf_counter() - began
+
+    return {
+        "mouse_events_per_sec": samples / elapsed,
+        "native_moves_per_sec": window.native_moves / elapsed,
+        "handler_ms_per_sec": window.handler_time * 1000 / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--rate", type=int, default=1000, help="合成鼠标事件频率 (Hz)")
+    args = parser.parse_args()
+
+    for name, value in run(args.seconds, args.rate).items():
+        print(f"{name}: {value:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""共享内存实时数据的读取开销与端到端延迟（另一个进程写入，本进程轮询读取）。
+
+用法（在仓库根目录，无需 Qt）：
+    python -m benchmarks.bench_live_feed [--updates 2000] [--rate 1000]
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+from components.live_feed import LiveFeedReader, LiveFeedWriter
+
+
+def _writer(path, updates, rate, ready):
+    writer = LiveFeedWriter(path)
+    ready.set()
+    interval = 1 / rate
+    for i in range(updates):
+        writer.publish(i, 40909, 123456, 3600, 0.5, 1)
+        time.sleep(interval)
+    writer.close()
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--rate", type=int, default=1000, help="写入频率 (Hz)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.feed")
+        LiveFeedWriter(path).close()
+        reader = LiveFeedReader(path)
+
+        # 单次读取开销（无并发写入）
+        number = 100000
+        t0 = time.perf_counter()
+        for _ in range(number):
+            reader.read()
+        read_ns = (time.perf_counter() - t0) / number * 1e9
+
+        ready = multiprocessing.Event()
+        process = multiprocessing.Process(
+            target=_writer, args=(path, args.updates, args.rate, ready)
+        )
+        process.start()
+        ready.wait()
+
+        # 端到端：写入时间戳到读者看到新 seq 的时间
+        latencies = []
+        last_seq = None
+        while process.is_alive() or len(latencies) < 1:
+            seq, values = reader.read()
+            if seq != last_seq and values["wall_time"]:
+                if last_seq is not None:
+                    latencies.append(time.time() - values["wall_time"])
+                last_seq = seq
+            if not process.is_alive():
+                break
+        process.join()
+        reader.close()
+
+    print(f"read: {read_ns:.0f} ns per read")
+    if latencies:
+        print(
+            f"publish -> read latency over {len(latencies)} updates: "
+            f"p50 {statistics.median(latencies) * 1e6:.1f} us, "
+            f"p99 {percentile(latencies, 0.99) * 1e6:.1f} us"
+        )
+    print(f"torn-read retries: {reader.retries}")
+
+
+if __name__ == "__main__":
+    main()
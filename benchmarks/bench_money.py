@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""测量整数金额运算在每秒 tick 热路径上的耗时（正确性见 tests/test_money.py）。
+
+用法（在仓库根目录，无需 Qt）：
+    python -m benchmarks.bench_money
+"""
+import argparse
+import timeit
+
+from components.money import DailyAccrual, format_cents, to_cents
+
+TOTAL_SECONDS = 9 * 3600
+
+
+def bench_hot_path(number=200000):
+    accrual = DailyAccrual(to_cents("12345.67"), 21, 7, TOTAL_SECONDS)
+    seconds = 12345
+
+    def tick():
+        earned = accrual.earned_cents(seconds)
+        format_cents(accrual.month_before_cents + earned)
+        return format_cents(earned)
+
+    return min(timeit.repeat(tick, number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+    print(f"hot path: {bench_hot_path(args.number) * 1e9:.0f} ns per tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def qt_app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def spin(app, seconds):
+    """运行事件循环一段时间（定时器与动画照常推进）。"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def spin_until(app, predicate, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("condition not reached")
+        app.processEvents()
+
+
+def measure(func, repeat=200, warmup=10):
+    """重复调用 func，返回每次调用耗时的中位数（秒）。"""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""在离屏平台上回放输入轨迹，测量贴边唤出与自动隐藏的端到端延迟。
+
+    光标触到屏幕边缘 -> 唤出动画第一帧 / 最后一帧
+    光标离开窗口     -> 开始隐藏
+
+轨迹由 components/input_trace.py 录制（SALARY_TRACE_FILE=...），也可以用 --synthetic 生成。
+用法（在仓库根目录）：
+    python -m benchmarks.replay_trace trace.jsonl
+    python -m benchmarks.replay_trace --synthetic 20 --poll-interval 100
+"""
+import argparse
+import json
+import random
+import time
+
+from benchmarks.common import qt_app, spin
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect
+from PySide6.QtGui import QEnterEvent
+
+from components.ui_window import AutoHideWindow
+
+
+class ReplayWindow(AutoHideWindow):
+    def __init__(self, clock, **kwargs):
+        super().__init__(**kwargs)
+        self.clock = clock
+        # 起始光标放在屏幕中央，不碰任何边缘，由轨迹里的第一次触边来唤出
+        self.replay_cursor = self.screen_geometry.center()
+        self.pending_touch = None
+        self.pending_leave = None
+        self.reveals = []
+        self.hide_latencies = []
+
+    def cursor_pos(self):
+        return self.replay_cursor
+
+    def show_full_window(self):
+        was_hidden = self._is_hidden
+        super().show_full_window()
+        if was_hidden and not self._is_hidden and self.pending_touch is not None:
+            record = {"touch": self.pending_touch}
+            self.pending_touch = None
+            self.reveals.append(record)
+
+            def on_frame(_):
+                record.setdefault("first", self.clock())
+
+            self.anim.valueChanged.connect(on_frame)
+            self.anim.finished.connect(lambda: record.setdefault("last", self.clock()))
+
+    def auto_hide_window(self):
+        was_hidden = self._is_hidden
+        super().auto_hide_window()
+        if not was_hidden and self._is_hidden and self.pending_leave is not None:
+            self.hide_latencies.append(self.clock() - self.pending_leave)
+            self.pending_leave = None
+
+    def touches_edge(self, cursor):
+        margin = self.auto_hide_margin
+        if self.hidden_edge == "left":
+            return cursor.x() <= margin
+        if self.hidden_edge == "right":
+            return cursor.x() >= self.screen_geometry.width() - margin
+        if self.hidden_edge == "top":
+            return cursor.y() <= margin
+        return False
+
+
+def load_trace(path):
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    if not records or records[0].get("type") != "header":
+        raise ValueError(f"{path}: missing header line")
+    return records[0], records[1:]
+
+
+def synthesize(cycles, seed=0):
+    """贴左边收起的窗口：光标滑到左边缘，停留，进入窗口，再离开。"""
+    rng = random.Random(seed)
+    header = {
+        "type": "header",
+        "screen": [0, 0, 1920, 1080],
+        "geometry": [1 - 320 + 5, 400, 320, 264],
+        "hidden_edge": "left",
+        "hidden": True,
+        "margin": 5,
+        "animation_duration": 250,
+        "hide_delay": 500,
+        "poll_interval": 200,
+    }
+    events = []
+    t = 0.5
+    for _ in range(cycles):
+        y = rng.randint(420, 640)
+        # 约 0.3 秒从 x=400 滑到边缘，100Hz 采样
+        for step in range(31):
+            events.append({"t": round(t, 4), "type": "cursor", "x": int(400 * (1 - step / 30)), "y": y})
+            t += 0.01
+        t += rng.uniform(0.3, 0.6)
+        events.append({"t": round(t, 4), "type": "cursor", "x": 40, "y": y})
+        events.append({"t": round(t, 4), "type": "enter"})
+        t += rng.uniform(0.8, 2.0)
+        events.append({"t": round(t, 4), "type": "cursor", "x": 600, "y": y})
+        events.append({"t": round(t, 4), "type": "leave"})
+        t += rng.uniform(1.2, 2.0)
+    return header, events
+
+
+def replay(header, events, overrides):
+    app = qt_app()
+    began = time.perf_counter()
+
+    def clock():
+        return time.perf_counter() - began
+
+    params = {
+        key: overrides.get(key) if overrides.get(key) is not None else header[key]
+        for key in ("animation_duration", "hide_delay", "poll_interval")
+    }
+    window = ReplayWindow(clock, margin=header["margin"], **params)
+    window.screen_geometry = QRect(*header["screen"])
+    window.replay_cursor = window.screen_geometry.center()
+    x, y, w, h = header["geometry"]
+    window.resize(w, h)
+    window.move(x, y)
+    window.show()
+    # show() 会按当前位置重算贴边状态，这里以录制时的状态为准
+    window.hidden_edge = header["hidden_edge"]
+    if header["hidden"]:
+        window._is_hidden = True
+        window.monitor_timer.start()
+    app.processEvents()
+
+    began = time.perf_counter()
+    for event in events:
+        spin(app, event["t"] - clock())
+        kind = event["type"]
+        if kind == "cursor":
+            window.replay_cursor = QPoint(event["x"], event["y"])
+            if (
+                window._is_hidden
+                and not window._is_animating
+                and window.pending_touch is None
+                and window.touches_edge(window.replay_cursor)
+            ):
+                window.pending_touch = clock()
+        elif kind == "enter":
+            window.pending_leave = None
+            local = QPointF(window.mapFromGlobal(window.replay_cursor))
+            global_pos = QPointF(window.replay_cursor)
+            QApplication.sendEvent(window, QEnterEvent(local, local, global_pos))
+        elif kind == "leave":
+            if window.hidden_edge and not window._is_hidden:
+                window.pending_leave = clock()
+            QApplication.sendEvent(window, QEvent(QEvent.Leave))
+    spin(app, (params["animation_duration"] + params["hide_delay"]) / 1000 + 0.5)
+    window.close()
+    return window
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return (
+        f"n={len(ordered):<4d} p50 {pick(0.5) * 1000:7.1f}ms  p90 {pick(0.9) * 1000:7.1f}ms"
+        f"  p99 {pick(0.99) * 1000:7.1f}ms  max {ordered[-1] * 1000:7.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("trace", nargs="?", help="录制的轨迹文件（JSON Lines）")
+    parser.add_argument("--synthetic", type=int, metavar="CYCLES", help="生成合成轨迹")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="把合成轨迹写入文件")
+    parser.add_argument("--poll-interval", type=int, help="覆盖边缘轮询间隔 (ms)")
+    parser.add_argument("--animation-duration", type=int, help="覆盖滑动动画时长 (ms)")
+    parser.add_argument("--hide-delay", type=int, help="覆盖离开后隐藏延迟 (ms)")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        header, events = synthesize(args.synthetic, args.seed)
+        if args.save:
+            with open(args.save, "w", encoding="utf-8") as f:
+                for record in [header] + events:
+                    f.write(json.dumps(record) + "\n")
+    elif args.trace:
+        header, events = load_trace(args.trace)
+    else:
+        parser.error("需要轨迹文件或 --synthetic")
+
+    window = replay(
+        header,
+        events,
+        {
+            "poll_interval": args.poll_interval,
+            "animation_duration": args.animation_duration,
+            "hide_delay": args.hide_delay,
+        },
+    )
+
+    first = [r["first"] - r["touch"] for r in window.reveals if "first" in r]
+    last = [r["last"] - r["touch"] for r in window.reveals if "last" in r]
+    print(f"edge touch -> first frame: {percentiles(first) if first else 'no reveals'}")
+    print(f"edge touch -> last frame:  {percentiles(last) if last else 'no reveals'}")
+    hides = window.hide_latencies
+    print(f"leave -> hide start:       {percentiles(hides) if hides else 'no hides'}")
+
+
+if __name__ == "__main__":
+    main()
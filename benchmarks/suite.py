@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""离屏基准套件：与存储的基线比较，超出容差即视为性能回退。
+
+用法（在仓库根目录）：
+    python -m benchmarks.suite                 # 运行并与 baselines.json 比较
+    python -m benchmarks.suite --update        # 运行并写入新的基线
+    python -m benchmarks.suite --tolerance 0.3 --only paint
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import REPO_ROOT, measure, qt_app
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QEventLoop, QPoint, QSettings, QTime
+from PySide6.QtGui import QImage, QRegion
+
+from components.ui_widget import ResultPage, SalaryCalculatorWidget
+from components.ui_window import AutoHideWindow
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+PAINT_SIZES = ((320, 220), (640, 440), (1280, 880))
+PAINT_RATIOS = (1.0, 1.5, 2.0)
+
+# 启动子进程：进入事件循环后处理完首帧即退出
+STARTUP_SNIPPET = """
+import runpy, sys
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+_exec = QApplication.exec
+def _exec_first_frame(self=None):
+    app = QApplication.instance()
+    QTimer.singleShot(0, app.quit)
+    return _exec()
+QApplication.exec = _exec_first_frame
+sys.argv = ["main.py"]
+runpy.run_path("main.py", run_name="__main__")
+"""
+
+
+def bench_update_ui(app):
+    page = ResultPage()
+    page.resize(300, 200)
+    page.apply_settings(10000.0, 22, QTime(8, 30), QTime(17, 30))
+    return {"update_ui": measure(page.update_ui, repeat=500)}
+
+
+def bench_paint(app):
+    results = {}
+    for mode in ("translucent", "opaque"):
+        window = AutoHideWindow(render_mode=mode)
+        for width, height in PAINT_SIZES:
+            window.resize(width, height)
+            for ratio in PAINT_RATIOS:
+                image = QImage(
+                    int(width * ratio),
+                    int(height * ratio),
+                    QImage.Format_ARGB32_Premultiplied,
+                )
+                image.setDevicePixelRatio(ratio)
+                # 只绘制窗口自身（不含子控件），即 paintEvent 的开销
+                render = lambda: window.render(
+                    image, QPoint(), QRegion(), QWidget.DrawWindowBackground
+                )
+                name = f"paint_{mode}_{width}x{height}@{ratio:g}x"
+                results[name] = measure(render, repeat=100)
+        window.deleteLater()
+    return results
+
+
+def bench_widget_build(app):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        empty = QSettings(os.path.join(tmp, "empty.ini"), QSettings.IniFormat)
+        saved = QSettings(os.path.join(tmp, "saved.ini"), QSettings.IniFormat)
+        saved.setValue("salary", 10000.0)
+        saved.setValue("days", 22)
+        saved.setValue("start", "08:30")
+        saved.setValue("end", "17:30")
+        saved.sync()
+
+        for name, settings in (("build_widget_empty", empty), ("build_widget_saved", saved)):
+            widgets = []
+            results[name] = measure(
+                lambda: widgets.append(SalaryCalculatorWidget(settings)), repeat=30
+            )
+            for widget in widgets:
+                widget.deleteLater()
+            app.processEvents()
+    return results
+
+
+def bench_startup(app, repeat=5):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    samples = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # 让子进程的配置和实时数据文件落在临时目录：退出时保存的窗口位置
+        # 不会覆盖用户配置（各平台都改用 INI 文件），也不会覆盖正在运行的实例的数据
+        env["SALARY_SETTINGS_FILE"] = os.path.join(tmp, "settings.ini")
+        env["SALARY_FEED_PATH"] = os.path.join(tmp, "startup.feed")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-c", STARTUP_SNIPPET], cwd=REPO_ROOT, env=env, check=True
+            )
+            samples.append(time.perf_counter() - t0)
+    return {"startup_first_frame": statistics.median(samples)}
+
+
+def bench_slide_cycle(app, repeat=3):
+    window = AutoHideWindow()
+    window.resize(320, 220)
+    window.move(0, 200)
+    window.show()
+    app.processEvents()
+
+    def wait_for_animation():
+        # 阻塞在事件循环里等待动画结束，空闲时不占用 CPU
+        if window._is_animating:
+            loop = QEventLoop()
+            window.anim.finished.connect(loop.quit)
+            loop.exec()
+
+    # 动画时长是固定常量，墙钟时间几乎全是等待；这里只统计一次往返消耗的 CPU 时间
+    samples = []
+    for _ in range(repeat):
+        t0 = time.process_time()
+        window.auto_hide_window()
+        wait_for_animation()
+        window.show_full_window()
+        wait_for_animation()
+        samples.append(time.process_time() - t0)
+    window.close()
+    return {"slide_cycle_cpu": statistics.median(samples)}
+
+
+BENCHMARKS = {
+    "update_ui": bench_update_ui,
+    "paint": bench_paint,
+    "widget_build": bench_widget_build,
+    "startup": bench_startup,
+    "slide_cycle": bench_slide_cycle,
+}
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(results, baselines, tolerance):
+    """返回 (回退的基准, 缺少基线的基准)。"""
+    regressions = []
+    missing = []
+    for name, value in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            status = "MISSING BASELINE"
+            missing.append(name)
+        elif value > baseline * (1 + tolerance):
+            status = "REGRESSION"
+            regressions.append(name)
+        else:
+            status = "ok"
+        baseline_text = "-" if baseline is None else f"{baseline * 1000:.3f}ms"
+        print(f"{name:32s} {value * 1000:10.3f}ms  baseline {baseline_text:>12s}  {status}")
+    return regressions, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baselines", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="允许的相对变慢比例")
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS))
+    parser.add_argument("--update", action="store_true", help="把本次结果写入基线")
+    args = parser.parse_args()
+
+    app = qt_app()
+    results = {}
+    for name in args.only or BENCHMARKS:
+        results.update(BENCHMARKS[name](app))
+
+    baselines = load_baselines(args.baselines)
+    regressions, missing = compare(results, baselines, args.tolerance)
+
+    if args.update:
+        baselines.update(results)
+        with open(args.baselines, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+        print(f"baselines written to {args.baselines}")
+        return
+
+    # 没有基线的结果无法判断是否回退，同样视为失败，避免门禁形同虚设
+    if missing:
+        print(
+            f"{len(missing)} benchmark(s) have no baseline in {args.baselines}; "
+            "record them with --update on the reference machine"
+        )
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed beyond {args.tolerance:.0%}")
+    if missing or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
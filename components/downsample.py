@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Largest-Triangle-Three-Buckets 降采样：保留折线形状，把点数压到目标像素宽度。"""
+
+
+def lttb(xs, ys, threshold):
+    """返回保留下来的点的下标列表（首尾必留）。"""
+    length = len(xs)
+    if threshold >= length or threshold < 3:
+        return list(range(length))
+
+    indices = [0]
+    bucket_size = (length - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # 下一个桶的平均点作为三角形的第三个顶点
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, length)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = xs[a], ys[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        indices.append(best)
+        a = best
+    indices.append(length - 1)
+    return indices
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""窗口长时间不可见时回收内存：释放可重建的缓存和页面，完整 GC，
+再把空闲堆内存还给操作系统。下次显示时各部件按需重建。
+"""
+import ctypes
+import ctypes.util
+import gc
+import logging
+import os
+import sys
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QPixmapCache
+
+from components.metrics import METRICS
+from components.scheduler import HIGH, default_wheel
+
+log = logging.getLogger(__name__)
+
+
+def current_rss():
+    """当前进程常驻内存（字节）；无法获取时返回 None。"""
+    if sys.platform == "win32":
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(
+            process, ctypes.byref(counters), counters.cb
+        ):
+            return counters.WorkingSetSize
+        return None
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def release_heap():
+    """把空闲的堆内存归还给操作系统（glibc malloc_trim / Windows 工作集收缩）。"""
+    if sys.platform == "win32":
+        kernel32 = ctypes.windll.kernel32
+        kernel32.SetProcessWorkingSetSize(
+            kernel32.GetCurrentProcess(), ctypes.c_size_t(-1), ctypes.c_size_t(-1)
+        )
+        return
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return
+    libc = ctypes.CDLL(libc_name)
+    if hasattr(libc, "malloc_trim"):
+        libc.malloc_trim(0)
+
+
+class IdleTrimmer(QObject):
+    # (回收前 RSS, 回收后 RSS)，单位字节，无法获取时为 -1
+    trimmed = Signal(int, int)
+
+    def __init__(self, targets, delay_minutes=10, parent=None):
+        super().__init__(parent)
+        self._targets = list(targets)
+        self._delay_ms = int(delay_minutes * 60000)
+        # 计时需要在窗口隐藏期间继续，因此使用不受 hidden 策略影响的优先级
+        self._timer = default_wheel().timer(
+            "idle_trim", priority=HIGH, slack_ms=1000, single_shot=True, parent=self
+        )
+        self._timer.timeout.connect(self.trim)
+
+    def set_concealed(self, concealed):
+        if self._delay_ms <= 0:
+            return
+        if concealed:
+            self._timer.start(self._delay_ms)
+        else:
+            self._timer.stop()
+
+    def trim(self):
+        before = current_rss()
+        for target in self._targets:
+            target.release_caches()
+        QPixmapCache.clear()
+        gc.collect()
+        release_heap()
+        after = current_rss()
+
+        if METRICS.enabled:
+            METRICS.set_gauge(
+                "salary_idle_trim_rss_before_bytes", before or 0, "RSS before the last idle trim"
+            )
+            METRICS.set_gauge(
+                "salary_idle_trim_rss_after_bytes", after or 0, "RSS after the last idle trim"
+            )
+        log.info("idle trim: rss %s -> %s bytes", before, after)
+        self.trimmed.emit(-1 if before is None else before, -1 if after is None else after)
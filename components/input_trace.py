@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""录制真实的光标 / 进入 / 离开事件轨迹（JSON Lines），供 benchmarks/replay_trace.py 回放。
+
+设置环境变量 SALARY_TRACE_FILE=路径 启动即开始录制，退出时写完。
+第一行是窗口参数和初始状态，之后每行一个事件，t 为相对录制开始的秒数：
+
+    {"type": "header", "screen": [x, y, w, h], "geometry": [...], "hidden_edge": "left", ...}
+    {"t": 0.016, "type": "cursor", "x": 3, "y": 410}
+    {"t": 0.412, "type": "enter"}
+    {"t": 2.950, "type": "leave"}
+"""
+import json
+import time
+
+from PySide6.QtCore import QObject, QEvent
+from PySide6.QtGui import QCursor
+
+from components.scheduler import HIGH, default_wheel
+
+
+class TraceRecorder(QObject):
+    def __init__(self, window, path, sample_ms=10, parent=None):
+        super().__init__(parent)
+        self._window = window
+        self._file = open(path, "w", encoding="utf-8")
+        self._start = time.perf_counter()
+        self._last_cursor = None
+
+        screen = window.screen_geometry
+        geometry = window.geometry()
+        self._write(
+            {
+                "type": "header",
+                "screen": [screen.x(), screen.y(), screen.width(), screen.height()],
+                "geometry": [geometry.x(), geometry.y(), geometry.width(), geometry.height()],
+                "hidden_edge": window.hidden_edge,
+                "hidden": window._is_hidden,
+                "margin": window.auto_hide_margin,
+                "animation_duration": window.animation_duration,
+                "hide_delay": window.hide_delay,
+                "poll_interval": window.poll_interval,
+            }
+        )
+
+        # 只在录制时才装事件过滤器，正常运行不增加 Python 事件回调
+        window.installEventFilter(self)
+        self._timer = default_wheel().timer("trace", priority=HIGH, parent=self)
+        self._timer.timeout.connect(self.sample_cursor)
+        self._timer.start(sample_ms)
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _now(self):
+        return round(time.perf_counter() - self._start, 6)
+
+    def sample_cursor(self):
+        pos = QCursor.pos()
+        point = (pos.x(), pos.y())
+        if point != self._last_cursor:
+            self._last_cursor = point
+            self._write({"t": self._now(), "type": "cursor", "x": point[0], "y": point[1]})
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind == QEvent.Enter:
+            self._write({"t": self._now(), "type": "enter"})
+        elif kind == QEvent.Leave:
+            self._write({"t": self._now(), "type": "leave"})
+        return False
+
+    def close(self):
+        self._timer.stop()
+        self._window.removeEventFilter(self)
+        self._file.close()
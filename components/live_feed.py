@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""共享内存实时数据：应用把每次 tick 的结果写入固定布局的内存映射文件，
+其他进程（脚本、状态栏）用一次 mmap 读取即可，无需再算一遍或走 IPC。
+
+只依赖标准库，可单独复制使用。布局（小端，共 64 字节）：
+
+    偏移  类型      字段
+    0     4s        magic  b"RTSF"
+    4     uint16    version
+    6     uint16    size（整个结构的字节数）
+    8     uint64    seq    序号：写入中为奇数，写完为偶数
+    16    float64   wall_time         写入时的 Unix 时间戳
+    24    int64     earned_cents      今日已赚（分）
+    32    int64     today_total_cents 今日总计（分）
+    40    int64     month_earned_cents本月累计（分）
+    48    int32     seconds_left      下班倒计时（秒）
+    52    float32   progress          今日进度 0~1
+    56    uint8     status            0 未知 / 1 工作中 / 2 下班 / 3 休息日
+    57    3x        填充
+    60    uint32    pid               写入进程 PID
+
+读者先读 seq，再读数据，再读 seq；两次 seq 相同且为偶数才是完整的一帧（seqlock），
+否则说明读到了写了一半的数据，重试即可。
+
+    python -m components.live_feed          # 打印一次
+    python -m components.live_feed --watch  # 每秒打印
+"""
+import getpass
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+import time
+
+MAGIC = b"RTSF"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQ")
+_SEQ = struct.Struct("<Q")
+_PAYLOAD = struct.Struct("<dqqqifBxxxI")
+SEQ_OFFSET = 8
+PAYLOAD_OFFSET = _HEADER.size
+SIZE = _HEADER.size + _PAYLOAD.size
+
+STATUS_CODES = {"工作中": 1, "下班": 2, "休息日": 3}
+STATUS_NAMES = {0: "未知", 1: "工作中", 2: "下班", 3: "休息日"}
+
+FIELDS = (
+    "wall_time",
+    "earned_cents",
+    "today_total_cents",
+    "month_earned_cents",
+    "seconds_left",
+    "progress",
+    "status",
+    "pid",
+)
+
+
+FEED_NAME = "real-timesalary.feed"
+
+
+def _private_dir(path):
+    """创建（或校验）只属于当前用户的目录：不能是符号链接，其他用户不可访问。"""
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(f"{path}: not a private directory of the current user")
+    return path
+
+
+def feed_dir():
+    """每个用户自己的运行时目录，不使用共享的临时目录根。"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or tempfile.gettempdir()
+        path = os.path.join(base, "Real-time Salary")
+        os.makedirs(path, exist_ok=True)
+        return path
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return runtime
+    # 没有 XDG_RUNTIME_DIR 时（如 macOS）在临时目录下建私有子目录，与 Qt 的 RuntimeLocation 做法一致
+    return _private_dir(
+        os.path.join(tempfile.gettempdir(), f"real-timesalary-{getpass.getuser()}")
+    )
+
+
+def default_feed_path():
+    path = os.environ.get("SALARY_FEED_PATH")
+    if path:
+        return path
+    return os.path.join(feed_dir(), FEED_NAME)
+
+
+def _open_feed(path, flags):
+    # O_NOFOLLOW：路径被替换成符号链接时拒绝打开，不会顺着链接改写别的文件
+    flags |= getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o600)
+    try:
+        info = os.fstat(fd)
+        if not stat.S_ISREG(info.st_mode):
+            raise PermissionError(f"{path}: not a regular file")
+        if hasattr(os, "getuid") and info.st_uid != os.getuid():
+            raise PermissionError(f"{path}: owned by another user")
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+
+class TornRead(Exception):
+    pass
+
+
+class LiveFeedWriter:
+    def __init__(self, path=None):
+        self.path = path or default_feed_path()
+        fd = _open_feed(self.path, os.O_RDWR | os.O_CREAT)
+        try:
+            os.ftruncate(fd, SIZE)
+            self._map = mmap.mmap(fd, SIZE)
+        finally:
+            os.close(fd)
+        self._seq = 0
+        self._pid = os.getpid()
+        _HEADER.pack_into(self._map, 0, MAGIC, VERSION, SIZE, self._seq)
+
+    def publish(self, earned_cents, today_total_cents, month_earned_cents, seconds_left, progress, status):
+        # seqlock：先置为奇数，写完数据再置为偶数
+        self._seq += 1
+        _SEQ.pack_into(self._map, SEQ_OFFSET, self._seq)
+        _PAYLOAD.pack_into(
+            self._map,
+            PAYLOAD_OFFSET,
+            time.time(),
+            earned_cents,
+            today_total_cents,
+            month_earned_cents,
+            seconds_left,
+            progress,
+            status,
+            self._pid,
+        )
+        self._seq += 1
+        _SEQ.pack_into(self._map, SEQ_OFFSET, self._seq)
+
+    def publish_tick(self, tick):
+        """直接接收 ResultPage.ticked 的快照。"""
+        self.publish(
+            tick["earned_cents"],
+            tick["today_total_cents"],
+            tick["month_earned_cents"],
+            tick["seconds_left"],
+            tick["progress"],
+            STATUS_CODES.get(tick["status"], 0),
+        )
+
+    def close(self):
+        self._map.close()
+
+
+class LiveFeedReader:
+    def __init__(self, path=None):
+        self.path = path or default_feed_path()
+        fd = _open_feed(self.path, os.O_RDONLY)
+        try:
+            self._map = mmap.mmap(fd, SIZE, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        magic, version, size, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or size != SIZE:
+            self._map.close()
+            raise ValueError(f"{self.path}: unsupported feed (version {version})")
+        self.retries = 0
+
+    def read(self, attempts=100):
+        """返回 (seq, 字段字典)；连续读到写了一半的数据时抛出 TornRead。"""
+        buf = self._map
+        for _ in range(attempts):
+            (seq,) = _SEQ.unpack_from(buf, SEQ_OFFSET)
+            if not seq & 1:
+                values = _PAYLOAD.unpack_from(buf, PAYLOAD_OFFSET)
+                if _SEQ.unpack_from(buf, SEQ_OFFSET)[0] == seq:
+                    return seq, dict(zip(FIELDS, values))
+            self.retries += 1
+        raise TornRead(self.path)
+
+    def close(self):
+        self._map.close()
+
+
+def _format(values):
+    left = values["seconds_left"]
+    return (
+        f"{STATUS_NAMES.get(values['status'], '未知')} "
+        f"￥{values['earned_cents'] / 100:.2f} / ￥{values['today_total_cents'] / 100:.2f} "
+        f"下班倒计时 {left // 3600:02d}:{left % 3600 // 60:02d}:{left % 60:02d}"
+    )
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="读取 Real-time Salary 的实时数据")
+    parser.add_argument("--path", default=None)
+    parser.add_argument("--watch", action="store_true")
+    args = parser.parse_args()
+
+    reader = LiveFeedReader(args.path)
+    try:
+        while True:
+            _, values = reader.read()
+            print(_format(values), flush=True)
+            if not args.watch:
+                break
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""运行时指标：低开销直方图 + Prometheus 文本格式导出。
+
+通过环境变量 SALARY_METRICS=1 开启。关闭时 ``timed`` 直接返回原函数，
+其余埋点只剩一次 ``METRICS.enabled`` 判断。
+"""
+import functools
+import os
+import shutil
+import time
+from bisect import bisect_left
+
+# 秒为单位的默认桶：0.1ms ~ 2.5s
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.016, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+# 每分钟唤醒次数的桶
+WAKEUP_BUCKETS = (10, 30, 60, 120, 300, 600, 1200, 3000, 6000)
+
+
+class Histogram:
+    __slots__ = ("name", "help", "bounds", "counts", "sum", "count")
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """按桶线性插值估算分位数，没有样本时返回 None。"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            upper = self.bounds[i] if i < len(self.bounds) else lower
+            if n and seen + n >= rank:
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+            lower = upper
+        return lower
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, n in zip(self.bounds, self.counts):
+            cumulative += n
+            lines.append(f'{self.name}_bucket{{le="{bound:g}"}} {cumulative}')
+        lines.append(f'{self.name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{self.name}_sum {self.sum:.9g}")
+        lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+class Gauge:
+    __slots__ = ("name", "help", "value")
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self.value = 0.0
+
+    def set(self, value):
+        self.value = value
+
+    def expose(self):
+        return [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {self.value:.9g}",
+        ]
+
+
+class Registry:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._metrics = {}
+        self._wakeups = 0
+        self._wakeup_window_start = time.monotonic()
+
+    def histogram(self, name, help_text="", buckets=DEFAULT_BUCKETS):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Histogram(name, help_text, buckets)
+        return metric
+
+    def gauge(self, name, help_text=""):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Gauge(name, help_text)
+        return metric
+
+    def observe(self, name, value):
+        self.histogram(name).observe(value)
+
+    def set_gauge(self, name, value, help_text=""):
+        self.gauge(name, help_text).set(value)
+
+    def get(self, name):
+        return self._metrics.get(name)
+
+    # ---------- 唤醒计数 ----------
+    def wakeup(self):
+        self._wakeups += 1
+        now = time.monotonic()
+        elapsed = now - self._wakeup_window_start
+        if elapsed >= 60:
+            self.histogram(
+                "salary_wakeups_per_minute",
+                "Timer wakeups per minute",
+                WAKEUP_BUCKETS,
+            ).observe(self._wakeups * 60 / elapsed)
+            self._wakeups = 0
+            self._wakeup_window_start = now
+
+    def timed(self, name, help_text=""):
+        """函数耗时装饰器；关闭指标时原样返回被装饰的函数。"""
+
+        def decorator(func):
+            if not self.enabled:
+                return func
+            histogram = self.histogram(name, help_text)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                t0 = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    histogram.observe(time.perf_counter() - t0)
+
+            return wrapper
+
+        return decorator
+
+    # ---------- 导出 ----------
+    def expose(self):
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+
+class RotatingExporter:
+    """每次把完整快照原子地重写到 path（临时文件 + os.replace），
+    之前的快照依次轮转到 path.1 ... path.N，每个文件都是合法的 Prometheus 文本。
+    """
+
+    def __init__(self, registry, path, backup_count=3):
+        self.registry = registry
+        self.path = path
+        self.backup_count = backup_count
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def _rotate(self):
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        # 复制而非移动，保证 path 始终存在
+        shutil.copyfile(self.path, f"{self.path}.1")
+
+    def write(self):
+        text = self.registry.expose()
+        if self.backup_count > 0 and os.path.exists(self.path):
+            self._rotate()
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, self.path)
+
+
+METRICS = Registry(enabled=os.environ.get("SALARY_METRICS", "") not in ("", "0"))
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""定点整数金额运算。
+
+舍入规则：
+    1. 输入的月工资按四舍五入精确到分（to_cents）。
+    2. 月工资按“累计向下取整”分摊到各工作日：前 k 天合计 = 月工资 * k // 天数，
+       因此各日金额之和恰好等于月工资，月累计与逐日累加永远一致。
+    3. 当日已赚 = 当日金额（分）* 已工作秒数 // 当日总秒数，即向下取整到分，
+       上班时刻为 0，下班时刻恰好等于当日金额，中间单调不减。
+
+每秒刷新的路径只做整数乘除，格式化也只用整数拼接。
+"""
+from decimal import ROUND_HALF_UP, Decimal
+
+_TWO_DIGITS = tuple(f"{i:02d}" for i in range(100))
+
+
+def to_cents(value):
+    cents = (Decimal(str(value)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    return int(cents)
+
+
+def cumulative_share(total_cents, parts, index):
+    """前 index 份合计（分），index 取 0..parts。"""
+    return total_cents * index // parts
+
+
+def format_cents(cents):
+    yuan, cent = divmod(cents, 100)
+    return f"{yuan}.{_TWO_DIGITS[cent]}"
+
+
+class DailyAccrual:
+    """某个工作日的收入分摊，按天预先计算，tick 时只做整数运算。
+
+    day_index 为本月此前已过的工作日数；is_workday 为 False 时当日金额为 0。
+    """
+
+    __slots__ = ("day_cents", "month_before_cents", "total_seconds")
+
+    def __init__(self, month_cents, days, day_index, total_seconds, is_workday=True):
+        self.month_before_cents = cumulative_share(month_cents, days, day_index)
+        if is_workday and day_index < days:
+            self.day_cents = (
+                cumulative_share(month_cents, days, day_index + 1)
+                - self.month_before_cents
+            )
+        else:
+            self.day_cents = 0
+        self.total_seconds = total_seconds
+
+    def earned_cents(self, seconds):
+        return self.day_cents * seconds // self.total_seconds
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""插件接口：订阅共享 tick，耗时工作放到有界线程池，结果批量回到 GUI 线程。
+
+    class MyPlugin(TickPlugin):
+        name = "weather"
+        budget_ms = 200
+
+        def create_widget(self):      # GUI 线程，可选：放到标题栏左侧
+            self.label = QLabel()
+            return self.label
+
+        def compute(self, tick):       # 工作线程：I/O、解析等，不要碰任何 Qt 控件
+            return read_something()
+
+        def apply(self, result):       # GUI 线程：更新界面
+            self.label.setText(result)
+
+    window.addPlugin(MyPlugin())
+"""
+import logging
+import queue
+import re
+import threading
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, Signal
+
+from components.metrics import METRICS
+from components.scheduler import HIGH, default_wheel
+
+log = logging.getLogger(__name__)
+
+
+class TickPlugin:
+    name = "plugin"
+    # 单次 compute 的时间预算（毫秒），超出会被看门狗报告
+    budget_ms = 100
+    # 每隔多少个 tick 运行一次
+    every_ticks = 1
+
+    def create_widget(self):
+        return None
+
+    def compute(self, tick):
+        return None
+
+    def apply(self, result):
+        pass
+
+
+class _Slot:
+    __slots__ = ("plugin", "metric", "started", "reported", "skipped", "overruns")
+
+    def __init__(self, plugin):
+        self.plugin = plugin
+        # Prometheus 指标名只允许 [a-zA-Z0-9_]
+        self.metric = "salary_plugin_{}_seconds".format(
+            re.sub(r"[^a-zA-Z0-9_]", "_", plugin.name)
+        )
+        self.started = None  # 正在运行时为开始时间
+        self.reported = False
+        self.skipped = 0
+        self.overruns = 0
+
+
+class PluginHost(QObject):
+    # (插件名, 已用时秒数)
+    overrun = Signal(str, float)
+    _results_ready = Signal()
+
+    def __init__(self, max_workers=2, parent=None):
+        super().__init__(parent)
+        # 守护线程：卡在 I/O 里的插件不会让解释器退出时一直等待
+        self._jobs = queue.SimpleQueue()
+        self._workers = max_workers
+        for index in range(max_workers):
+            threading.Thread(
+                target=self._worker, name=f"salary-plugin_{index}", daemon=True
+            ).start()
+        self._slots = []
+        self._tick_count = 0
+        self._results = deque()
+        self._lock = threading.Lock()
+        self._flush_pending = False
+        self._closed = False
+        # 跨线程发射，自动排队到 GUI 线程
+        self._results_ready.connect(self._flush_results)
+
+        # 看门狗按最早的预算截止时间单次唤醒；高优先级，窗口隐藏时照常检查
+        self._watchdog = default_wheel().timer(
+            "plugin_watchdog", priority=HIGH, single_shot=True, parent=self
+        )
+        self._watchdog.timeout.connect(self._on_watchdog)
+
+    def register(self, plugin):
+        self._slots.append(_Slot(plugin))
+
+    def plugins(self):
+        return [slot.plugin for slot in self._slots]
+
+    def on_tick(self, tick):
+        if self._closed:
+            return
+        self._tick_count += 1
+        now = time.monotonic()
+
+        for slot in self._slots:
+            if self._tick_count % slot.plugin.every_ticks:
+                continue
+            # 每个插件最多一个任务在途，慢插件只会丢 tick，不会堆积队列
+            if slot.started is not None:
+                slot.skipped += 1
+                continue
+            slot.started = now
+            slot.reported = False
+            self._jobs.put((slot, tick))
+        self._arm_watchdog(now)
+
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if job is None or self._closed:
+                return
+            self._run(*job)
+
+    def _run(self, slot, tick):
+        t0 = time.monotonic()
+        try:
+            result, error = slot.plugin.compute(tick), None
+        except Exception as exc:  # 插件异常不能拖垮宿主
+            result, error = None, exc
+        elapsed = time.monotonic() - t0
+
+        with self._lock:
+            self._results.append((slot, result, error, elapsed))
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+        self._results_ready.emit()
+
+    def _flush_results(self):
+        with self._lock:
+            batch = list(self._results)
+            self._results.clear()
+            self._flush_pending = False
+
+        for slot, result, error, elapsed in batch:
+            slot.started = None
+            name = slot.plugin.name
+            if METRICS.enabled:
+                METRICS.observe(slot.metric, elapsed)
+            if elapsed * 1000 > slot.plugin.budget_ms and not slot.reported:
+                self._report_overrun(slot, elapsed)
+            if error is not None:
+                log.error("plugin %s failed", name, exc_info=error)
+                continue
+            try:
+                slot.plugin.apply(result)
+            except Exception:
+                log.exception("plugin %s failed to apply result", name)
+        self._arm_watchdog(time.monotonic())
+
+    def _arm_watchdog(self, now):
+        deadline = None
+        for slot in self._slots:
+            if slot.started is None or slot.reported:
+                continue
+            due = slot.started + slot.plugin.budget_ms / 1000
+            if deadline is None or due < deadline:
+                deadline = due
+        if deadline is None:
+            self._watchdog.stop()
+        else:
+            self._watchdog.start(max(0, int((deadline - now) * 1000) + 1))
+
+    def _on_watchdog(self):
+        now = time.monotonic()
+        self._check_overruns(now)
+        self._arm_watchdog(now)
+
+    def _check_overruns(self, now):
+        # 看门狗：在途任务超出预算时立即报告一次，不必等它结束
+        for slot in self._slots:
+            if slot.started is None or slot.reported:
+                continue
+            elapsed = now - slot.started
+            if elapsed * 1000 > slot.plugin.budget_ms:
+                self._report_overrun(slot, elapsed)
+
+    def _report_overrun(self, slot, elapsed):
+        slot.reported = True
+        slot.overruns += 1
+        log.warning(
+            "plugin %s overran its %d ms budget (%.0f ms)",
+            slot.plugin.name,
+            slot.plugin.budget_ms,
+            elapsed * 1000,
+        )
+        self.overrun.emit(slot.plugin.name, elapsed)
+
+    def shutdown(self):
+        # 不等待在途任务：排队中的任务被丢弃，正在运行的随守护线程在退出时结束
+        self._closed = True
+        self._watchdog.stop()
+        for _ in range(self._workers):
+            self._jobs.put(None)
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""统一定时器轮：进程内所有周期任务和一次性截止任务共用一个 QTimer。
+
+每个任务有截止时间和允许的迟到量（slack）。唤醒时刻取所有任务
+“截止时间 + slack”的最小值，醒来后把已到期或即将到期（COALESCE_MS 内）
+的任务一并执行，相近的截止时间因此合并成一次唤醒。
+
+电源策略：
+    normal   全部按设定间隔运行
+    battery  NORMAL / LOW 任务间隔和 slack 拉长 BATTERY_STRETCH 倍
+    hidden   暂停 LOW 任务（窗口不可见时的界面刷新），其余同 battery
+"""
+import glob
+import os
+import sys
+import time
+
+from PySide6.QtCore import QObject, QTimer, QCoreApplication, Qt, Signal
+
+from components.metrics import METRICS
+
+HIGH, NORMAL, LOW = 0, 1, 2
+POLICIES = ("normal", "battery", "hidden")
+
+COALESCE_MS = 15
+BATTERY_STRETCH = 2
+
+
+def _now_ms():
+    return time.monotonic() * 1000
+
+
+class WheelTimer(QObject):
+    """与 QTimer 用法一致（timeout / start / stop / setInterval / setSingleShot）。"""
+
+    timeout = Signal()
+
+    def __init__(self, wheel, name, priority=NORMAL, slack_ms=None, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.priority = priority
+        self._wheel = wheel
+        self._interval = 0
+        self._slack_ms = slack_ms
+        self._single_shot = False
+        self.deadline = None  # 毫秒，None 表示未启动
+        key = id(self)
+        self.destroyed.connect(lambda *_: wheel._discard(key))
+        wheel._add(key, self)
+
+    def setInterval(self, msec):
+        self._interval = msec
+
+    def interval(self):
+        return self._interval
+
+    def setSingleShot(self, single_shot):
+        self._single_shot = single_shot
+
+    def isSingleShot(self):
+        return self._single_shot
+
+    def isActive(self):
+        return self.deadline is not None
+
+    def start(self, msec=None):
+        if msec is not None:
+            self._interval = msec
+        self.deadline = _now_ms() + self._wheel.effective_interval(self)
+        self._wheel._reschedule()
+
+    def stop(self):
+        if self.deadline is not None:
+            self.deadline = None
+            self._wheel._reschedule()
+
+    def slack(self):
+        if self._slack_ms is not None:
+            return self._slack_ms
+        # 默认允许迟到间隔的 10%，最多 50ms
+        return min(self._interval * 0.1, 50)
+
+
+class TimerWheel(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._timers = {}
+        self._policy = "normal"
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._wake)
+
+    def timer(self, name, priority=NORMAL, slack_ms=None, single_shot=False, parent=None):
+        timer = WheelTimer(self, name, priority, slack_ms, parent)
+        timer.setSingleShot(single_shot)
+        return timer
+
+    def _add(self, key, timer):
+        self._timers[key] = timer
+        if METRICS.enabled:
+            METRICS.histogram(
+                f"salary_{timer.name}_lateness_seconds",
+                f"Lateness of the {timer.name} timer",
+            )
+
+    def _discard(self, key):
+        self._timers.pop(key, None)
+
+    # ---------- 策略 ----------
+    def policy(self):
+        return self._policy
+
+    def set_policy(self, policy):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown power policy: {policy}")
+        if policy == self._policy:
+            return
+        self._policy = policy
+        self._reschedule()
+
+    def effective_interval(self, timer):
+        if timer.priority != HIGH and self._policy != "normal":
+            return timer.interval() * BATTERY_STRETCH
+        return timer.interval()
+
+    def _effective_slack(self, timer):
+        if timer.priority != HIGH and self._policy != "normal":
+            return timer.slack() * BATTERY_STRETCH
+        return timer.slack()
+
+    def _paused(self, timer):
+        return timer.priority == LOW and self._policy == "hidden"
+
+    # ---------- 调度 ----------
+    def _reschedule(self):
+        wake_at = None
+        for timer in self._timers.values():
+            if timer.deadline is None or self._paused(timer):
+                continue
+            latest = timer.deadline + self._effective_slack(timer)
+            if wake_at is None or latest < wake_at:
+                wake_at = latest
+        if wake_at is None:
+            self._timer.stop()
+        else:
+            self._timer.start(max(0, int(wake_at - _now_ms())))
+
+    def _wake(self):
+        now = _now_ms()
+        if METRICS.enabled:
+            METRICS.wakeup()
+
+        due = [
+            timer
+            for timer in list(self._timers.values())
+            if timer.deadline is not None
+            and not self._paused(timer)
+            and timer.deadline <= now + COALESCE_MS
+        ]
+        for timer in due:
+            if METRICS.enabled:
+                METRICS.observe(
+                    f"salary_{timer.name}_lateness_seconds",
+                    max(0.0, now - timer.deadline) / 1000,
+                )
+            if timer.isSingleShot():
+                timer.deadline = None
+            else:
+                # 保持相位；落后超过一个周期时从现在重新计时，避免补发
+                interval = self.effective_interval(timer)
+                timer.deadline += interval
+                if timer.deadline <= now:
+                    timer.deadline = now + interval
+        for timer in due:
+            timer.timeout.emit()
+        self._reschedule()
+
+
+_default_wheel = None
+
+
+def default_wheel():
+    global _default_wheel
+    if _default_wheel is None:
+        _default_wheel = TimerWheel(QCoreApplication.instance())
+    return _default_wheel
+
+
+def on_battery():
+    """尽力判断当前是否使用电池供电；无法判断时返回 False。"""
+    if sys.platform == "win32":
+        import ctypes
+
+        class SYSTEM_POWER_STATUS(ctypes.Structure):
+            _fields_ = [
+                ("ACLineStatus", ctypes.c_ubyte),
+                ("BatteryFlag", ctypes.c_ubyte),
+                ("BatteryLifePercent", ctypes.c_ubyte),
+                ("SystemStatusFlag", ctypes.c_ubyte),
+                ("BatteryLifeTime", ctypes.c_ulong),
+                ("BatteryFullLifeTime", ctypes.c_ulong),
+            ]
+
+        status = SYSTEM_POWER_STATUS()
+        if not ctypes.windll.kernel32.GetSystemPowerStatus(ctypes.byref(status)):
+            return False
+        return status.ACLineStatus == 0
+    if sys.platform.startswith("linux"):
+        for supply in glob.glob("/sys/class/power_supply/*"):
+            try:
+                with open(os.path.join(supply, "type")) as f:
+                    if f.read().strip() != "Mains":
+                        continue
+                with open(os.path.join(supply, "online")) as f:
+                    return f.read().strip() == "0"
+            except OSError:
+                continue
+    return False
+
+
+class PowerPolicy(QObject):
+    """根据窗口可见性和供电状态切换定时器轮的策略。"""
+
+    def __init__(self, wheel, check_interval=60000, parent=None):
+        super().__init__(parent)
+        self._wheel = wheel
+        self._hidden = False
+        self._battery = on_battery()
+
+        self._check_timer = wheel.timer("power", priority=LOW, slack_ms=5000, parent=self)
+        self._check_timer.timeout.connect(self.check_power)
+        self._check_timer.start(check_interval)
+        self._apply()
+
+    def set_hidden(self, hidden):
+        self._hidden = hidden
+        self._apply()
+
+    def check_power(self):
+        self._battery = on_battery()
+        self._apply()
+
+    def _apply(self):
+        if self._hidden:
+            self._wheel.set_policy("hidden")
+        elif self._battery:
+            self._wheel.set_policy("battery")
+        else:
+            self._wheel.set_policy("normal")
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPainter, QPixmap
+
+
+class CachedLayer:
+    """按 (尺寸, 设备像素比) 缓存的绘制图层，尺寸不变时 paintEvent 只需贴图。
+
+    render(painter, size) 在逻辑坐标下绘制整层内容。
+    """
+
+    def __init__(self, render):
+        self._render = render
+        self._key = None
+        self._pixmap = None
+
+    def pixmap(self, size, ratio):
+        key = (size.width(), size.height(), ratio)
+        if key != self._key:
+            pixmap = QPixmap(
+                max(1, round(size.width() * ratio)), max(1, round(size.height() * ratio))
+            )
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            self._render(painter, size)
+            painter.end()
+            self._key = key
+            self._pixmap = pixmap
+        return self._pixmap
+
+    def extend(self, draw):
+        """在已缓存的图层上追加绘制（增量更新），图层尚未生成时什么也不做。"""
+        if self._pixmap is None:
+            return False
+        painter = QPainter(self._pixmap)
+        draw(painter)
+        painter.end()
+        return True
+
+    def invalidate(self):
+        self._key = None
+        self._pixmap = None
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import os
+
+from PySide6.QtWidgets import QLabel
+from PySide6.QtCore import QStandardPaths
+
+from components.metrics import METRICS, RotatingExporter
+from components.scheduler import LOW, NORMAL, default_wheel
+
+
+def _ms(histogram, q):
+    value = histogram.quantile(q) if histogram else None
+    return "--" if value is None else f"{value * 1000:.1f}"
+
+
+class MetricsOverlay(QLabel):
+    """标题栏左侧的调试浮层：一行摘要，悬停显示完整指标。"""
+
+    def __init__(self, registry=METRICS, parent=None):
+        super().__init__(parent)
+        self._registry = registry
+        self.setStyleSheet("QLabel { font-size: 10px; color: #888; }")
+
+        # 与其他周期任务共用定时器轮，唤醒计入 salary_wakeups_per_minute
+        self._timer = default_wheel().timer("metrics_overlay", priority=LOW, parent=self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(1000)
+        self.refresh()
+
+    def refresh(self):
+        get = self._registry.get
+        wakeups = get("salary_wakeups_per_minute")
+        wakeups_text = "--" if not wakeups or not wakeups.count else (
+            f"{wakeups.sum / wakeups.count:.0f}"
+        )
+        self.setText(
+            f"tick {_ms(get('salary_update_ui_seconds'), 0.95)}ms"
+            f" | paint {_ms(get('salary_window_paint_seconds'), 0.95)}ms"
+            f" | frame {_ms(get('salary_animation_frame_interval_seconds'), 0.5)}ms"
+            f" | {wakeups_text}/min"
+        )
+        self.setToolTip(self._registry.expose())
+
+
+def default_metrics_path():
+    path = os.environ.get("SALARY_METRICS_FILE")
+    if path:
+        return path
+    base = QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation)
+    return os.path.join(base, "metrics.prom")
+
+
+def start_metrics_export(app, interval_ms=60000, path=None):
+    """开启指标时，定期重写快照文件并轮转旧快照；退出前再写一次。"""
+    if not METRICS.enabled:
+        return None
+    exporter = RotatingExporter(METRICS, path or default_metrics_path())
+    timer = default_wheel().timer(
+        "metrics_export", priority=NORMAL, slack_ms=5000, parent=app
+    )
+    timer.timeout.connect(exporter.write)
+    timer.start(interval_ms)
+    app.aboutToQuit.connect(exporter.write)
+    exporter.timer = timer
+    return exporter
+
+
+def metrics_overlay_requested():
+    return METRICS.enabled and os.environ.get("SALARY_METRICS_OVERLAY", "") not in (
+        "",
+        "0",
+    )
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+from array import array
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen, QTransform
+
+from components.downsample import lttb
+from components.ui_layer import CachedLayer
+
+
+class EarningsSparkline(QWidget):
+    """今日 / 本月收入迷你折线图。
+
+    数据使用单位坐标（x、y 均为 0~1）。每个 tick 只在缓存的路径和线条图层上
+    追加一段；尺寸变化或切换视图时才把序列按像素宽度（LTTB）降采样后整体重建，
+    绘制开销只与像素宽度有关。背景与线条各自是一层 CachedLayer。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(24)
+        self.setToolTip("点击切换 今日 / 本月")
+
+        self.mode = "day"
+        self._series = {"day": (array("f"), array("f")), "month": (array("f"), array("f"))}
+        self._path = QPainterPath()
+        self._last_column = -1
+        self._last_point = None
+
+        self._pen = QPen(QColor("#7286D3"), 1.5)
+        self._pen.setCosmetic(True)
+
+        self._background = CachedLayer(self.render_background)
+        self._line = CachedLayer(self.render_line)
+
+    # ---------- 数据 ----------
+    def reset_day(self):
+        xs, ys = self._series["day"]
+        del xs[:]
+        del ys[:]
+        if self.mode == "day":
+            self._rebuild()
+
+    def add_day_point(self, x, y):
+        xs, ys = self._series["day"]
+        if xs and x <= xs[-1]:
+            return
+        xs.append(x)
+        ys.append(y)
+        if self.mode == "day":
+            self._append_to_path(x, y)
+
+    def set_month_series(self, xs, ys):
+        self._series["month"] = (array("f", xs), array("f", ys))
+        if self.mode == "month":
+            self._rebuild()
+
+    def has_month_history(self):
+        return len(self._series["month"][0]) > 1
+
+    def set_mode(self, mode):
+        if mode != self.mode:
+            self.mode = mode
+            self._rebuild()
+
+    # ---------- 路径 ----------
+    def _transform(self):
+        # 单位坐标 -> 像素坐标（y 轴向上），上下各留 2px
+        h = self.height() - 4
+        return QTransform(self.width(), 0, 0, -h, 0, h + 2)
+
+    def _rebuild(self):
+        xs, ys = self._series[self.mode]
+        self._path = QPainterPath()
+        self._last_column = -1
+        self._last_point = None
+        if xs:
+            for i in lttb(xs, ys, max(3, self.width())):
+                self._extend_path(xs[i], ys[i])
+        self._line.invalidate()
+        self.update()
+
+    def _extend_path(self, x, y):
+        if self._last_point is None:
+            self._path.moveTo(x, y)
+        else:
+            self._path.lineTo(x, y)
+        self._last_point = QPointF(x, y)
+        self._last_column = int(x * self.width())
+
+    def _append_to_path(self, x, y):
+        # 同一像素列内的新点不改变画面，直接跳过
+        if int(x * self.width()) <= self._last_column:
+            return
+        previous = self._last_point
+        self._extend_path(x, y)
+        if previous is None:
+            return
+
+        transform = self._transform()
+        start = transform.map(previous)
+        end = transform.map(self._last_point)
+
+        def draw_segment(painter):
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self._pen)
+            painter.drawLine(start, end)
+
+        if self._line.extend(draw_segment):
+            self.update(QRectF(start, end).normalized().adjusted(-2, -2, 2, 2).toAlignedRect())
+
+    def release_caches(self):
+        # 图层在下次绘制时按缓存的路径重建
+        self._background.invalidate()
+        self._line.invalidate()
+
+    # ---------- 绘制 ----------
+    def render_background(self, painter, size):
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(255, 255, 255, 120))
+        painter.drawRoundedRect(QRectF(0, 0, size.width(), size.height()), 4, 4)
+
+    def render_line(self, painter, size):
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pen)
+        painter.setTransform(self._transform())
+        painter.drawPath(self._path)
+
+    def paintEvent(self, event):
+        ratio = self.devicePixelRatioF()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background.pixmap(self.size(), ratio))
+        painter.drawPixmap(0, 0, self._line.pixmap(self.size(), ratio))
+        painter.end()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._rebuild()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and (
+            self.mode == "month" or self.has_month_history()
+        ):
+            self.set_mode("month" if self.mode == "day" else "day")
+            event.accept()
+        else:
+            event.ignore()
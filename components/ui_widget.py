@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import datetime
+import os
+
 from PySide6.QtWidgets import (
     QWidget,
     QStackedWidget,
@@ -9,8 +12,15 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QTimeEdit,
     QFrame,
+    QCheckBox,
 )
-from PySide6.QtCore import QTimer, QTime, QSettings
+from PySide6.QtCore import QTime, QSettings, Signal
+
+from components.metrics import METRICS
+from components.money import DailyAccrual, cumulative_share, format_cents, to_cents
+from components.ui_sparkline import EarningsSparkline
+from components.scheduler import LOW, default_wheel
+from components.workday_calendar import WorkdayCalendar
 
 
 class SettingsPage(QWidget):
@@ -48,6 +58,13 @@ class SettingsPage(QWidget):
             QLabel {
                 font-size: 16px;
             }
+            QCheckBox {
+                font-size: 13px;
+                color: #555;
+            }
+            QLineEdit:disabled {
+                color: #aaa;
+            }
             QTimeEdit::down-button, QTimeEdit::up-button {
                 width: 0px;
                 height: 0px;
@@ -63,6 +80,10 @@ class SettingsPage(QWidget):
         self.days_input = QLineEdit()
         self.days_input.setPlaceholderText("每月工作天数")
 
+        # 勾选后按节假日日历自动计算每月工作天数
+        self.auto_days_check = QCheckBox("按法定节假日自动计算工作天数")
+        self.auto_days_check.toggled.connect(self.days_input.setDisabled)
+
         self.start_time = QTimeEdit()
         self.start_time.setDisplayFormat("HH:mm")
         self.start_time.setTime(QTime(8, 30))
@@ -86,15 +107,20 @@ class SettingsPage(QWidget):
         layout.addWidget(QLabel("🕔 下班时间"), 2, 1)
         layout.addWidget(self.end_time, 3, 1)
 
+        layout.addWidget(self.auto_days_check, 4, 0, 1, 2)
+
         # Save button
-        layout.addWidget(self.save_btn, 4, 0, 1, 2)  # Span across two columns
+        layout.addWidget(self.save_btn, 5, 0, 1, 2)  # Span across two columns
 
         # Set the layout for the window
         self.setLayout(layout)
 
 
 class ResultPage(QWidget):
-    def __init__(self):
+    # 每次刷新后发出的快照，供插件等订阅
+    ticked = Signal(dict)
+
+    def __init__(self, calendar=None):
         super().__init__()
         layout = QVBoxLayout(self)
         layout.setContentsMargins(8, 0, 8, 0)
@@ -119,6 +145,10 @@ class ResultPage(QWidget):
             #statusLabel {
                 color: #888;
             }
+            #monthLabel {
+                font-size: 13px;
+                color: #555;
+            }
             QPushButton {
                 background: qlineargradient(
                     x1:0, y1:0, x2:1, y2:0,
@@ -143,6 +173,9 @@ class ResultPage(QWidget):
 
         self.today_total_label = QLabel("今日总计: ￥0.00")
 
+        self.month_label = QLabel("本月累计: ￥0.00")
+        self.month_label.setObjectName("monthLabel")
+
         self.back_button = QPushButton("🔧 修改设置")
 
         layout.addWidget(self.countdown_label)
@@ -163,10 +196,15 @@ class ResultPage(QWidget):
         layout.addSpacing(8)
         layout.addWidget(self.amount_label)
         layout.addWidget(self.today_total_label)
+        layout.addWidget(self.month_label)
+
+        self.sparkline = EarningsSparkline()
+        layout.addWidget(self.sparkline)
         layout.addStretch()
         layout.addWidget(self.back_button)
 
-        self.timer = QTimer(self)
+        # 界面刷新属于低优先级：窗口不可见时由定时器轮暂停
+        self.timer = default_wheel().timer("tick", priority=LOW, parent=self)
         self.timer.timeout.connect(self.update_ui)
         self.timer.start(1000)
 
@@ -175,37 +213,90 @@ class ResultPage(QWidget):
         self.salary = 0
         self.days = 22
 
-    def update_ui(self):
+        # 工作日历：days 为当月工作天数（自动模式下按日历逐月计算）
+        self.calendar = calendar or WorkdayCalendar()
+        self.auto_days = False
+        self.manual_days = 22
+        self._day = None
+        self._is_workday = True
+        self._workdays_before = 0
+        self._accrual = None
+        self._month_cents = 0
+        self._sparkline_stale = False
+
+    def compute_tick(self):
+        """当前时刻的快照，界面刷新与实时数据共享共用。
+
+        只更新按天缓存的金额，不触碰任何控件：跨天时曲线只标记为过期，
+        由下一次 update_ui 重建，因此可以在界面 tick 暂停时单独调用。
+        """
         now = QTime.currentTime()
+        today = datetime.date.today()
+        if today != self._day:
+            self.refresh_day(today)
 
-        seconds_worked = self.seconds_today_worked(now)
-        total_seconds = self.work_start.secsTo(self.work_end)
-        status = "工作中" if self.work_start <= now <= self.work_end else "下班"
-        self.status_label.setText(f"工作状态: {status}")
+        if self._is_workday:
+            seconds_worked = self.seconds_today_worked(now)
+            status = "工作中" if self.work_start <= now <= self.work_end else "下班"
+        else:
+            seconds_worked = 0
+            status = "休息日"
+        secs_left = now.secsTo(self.work_end) if now < self.work_end else 0
+
+        accrual = self._accrual
+        earned = daily = month_earned = 0
+        progress_ratio = 0.0
+        if accrual is not None:
+            # 整数分运算，见 components/money.py 的舍入规则
+            earned = accrual.earned_cents(seconds_worked)
+            daily = accrual.day_cents
+            month_earned = min(accrual.month_before_cents + earned, self._month_cents)
+            progress_ratio = min(seconds_worked / accrual.total_seconds, 1.0)
+
+        return {
+            "status": status,
+            "seconds_left": secs_left,
+            "earned_cents": earned,
+            "today_total_cents": daily,
+            "month_earned_cents": month_earned,
+            "progress": progress_ratio,
+        }
+
+    @METRICS.timed("salary_update_ui_seconds", "Duration of ResultPage.update_ui")
+    def update_ui(self):
+        tick = self.compute_tick()
+        if self._sparkline_stale:
+            self._sparkline_stale = False
+            self.refresh_sparkline(self._month_cents)
+        self.status_label.setText(f"工作状态: {tick['status']}")
 
         # 下班倒计时
-        if now < self.work_end:
-            secs_left = now.secsTo(self.work_end)
-            h = secs_left // 3600
-            m = (secs_left % 3600) // 60
-            s = secs_left % 60
-            self.countdown_label.setText(f"下班倒计时: {h:02d}:{m:02d}:{s:02d}")
-        else:
-            self.countdown_label.setText("下班倒计时: 00:00:00")
-
-        if total_seconds > 0 and self.days > 0:
-            salary_per_sec = self.salary / self.days / total_seconds
-            earned = salary_per_sec * seconds_worked
-            self.amount_label.setText(f"￥{earned:.2f}")
-            self.today_total_label.setText(
-                f"今日总计: ￥{salary_per_sec * total_seconds:.2f}"
+        secs_left = tick["seconds_left"]
+        h = secs_left // 3600
+        m = (secs_left % 3600) // 60
+        s = secs_left % 60
+        self.countdown_label.setText(f"下班倒计时: {h:02d}:{m:02d}:{s:02d}")
+
+        if self._accrual is not None:
+            earned = tick["earned_cents"]
+            daily = tick["today_total_cents"]
+            self.amount_label.setText(f"￥{format_cents(earned)}")
+            self.today_total_label.setText(self._today_total_text)
+            self.month_label.setText(
+                f"本月累计: ￥{format_cents(tick['month_earned_cents'])}"
+                f"{self._month_total_text}"
             )
 
             # 更新进度条宽度
-            progress_ratio = min(seconds_worked / total_seconds, 1.0)
+            progress_ratio = tick["progress"]
             full_width = self.progress_bg.width()
             self.progress_bar.setFixedWidth(int(full_width * progress_ratio))
 
+            if daily:
+                self.sparkline.add_day_point(progress_ratio, earned / daily)
+
+        self.ticked.emit(tick)
+
     def seconds_today_worked(self, now):
         if now < self.work_start:
             return 0
@@ -214,19 +305,82 @@ class ResultPage(QWidget):
         else:
             return self.work_start.secsTo(now)
 
-    def apply_settings(self, salary, days, start, end):
+    def refresh_day(self, today):
+        # 每天只查一次日历，之后每个 tick 直接使用缓存结果
+        self._day = today
+        if self.auto_days:
+            self.days = self.calendar.workdays_in_month(today.year, today.month)
+            self._is_workday = self.calendar.is_workday(today)
+        else:
+            self.days = self.manual_days
+            self._is_workday = True
+        # 手动天数少于当月天数时，满 days 天后当日金额为 0，月累计停在月工资
+        self._workdays_before = min(self.days_before(today), self.days)
+        self.refresh_accrual()
+
+    def refresh_accrual(self):
+        # 当日分摊与不变的文字按天/按设置预先算好，tick 里只做整数运算
+        total_seconds = self.work_start.secsTo(self.work_end)
+        if total_seconds <= 0 or self.days <= 0:
+            self._accrual = None
+            return
+        month_cents = to_cents(self.salary)
+        self._month_cents = month_cents
+        self._accrual = DailyAccrual(
+            month_cents,
+            self.days,
+            self._workdays_before,
+            total_seconds,
+            self._is_workday,
+        )
+        self._today_total_text = f"今日总计: ￥{format_cents(self._accrual.day_cents)}"
+        self._month_total_text = f" / 预计 ￥{format_cents(month_cents)}"
+        self._sparkline_stale = True
+
+    def refresh_sparkline(self, month_cents):
+        # 今日曲线从上班时刻的 0 重新开始；本月曲线为每天开始时的月累计
+        self.sparkline.reset_day()
+        today = self._day
+        if today is None or month_cents <= 0:
+            return
+        next_month = (today.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+        last_day = (next_month - datetime.timedelta(days=1)).day
+        xs, ys = [], []
+        for day in range(1, today.day + 1):
+            done = min(self.days_before(today.replace(day=day)), self.days)
+            xs.append((day - 1) / last_day)
+            ys.append(cumulative_share(month_cents, self.days, done) / month_cents)
+        self.sparkline.set_month_series(xs, ys)
+
+    def days_before(self, day):
+        # 与 _is_workday 的口径一致：自动模式按日历跳过休息日，手动模式每天都算
+        if self.auto_days:
+            return self.calendar.workdays_before(day)
+        return day.day - 1
+
+    def apply_settings(self, salary, days, start, end, auto_days=False):
         self.salary = salary
-        self.days = days
+        self.manual_days = days
+        self.auto_days = auto_days
         self.work_start = start
         self.work_end = end
+        self.refresh_day(datetime.date.today())
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.update_ui()
 
 
+def open_app_settings():
+    """应用配置；设置 SALARY_SETTINGS_FILE 时改用该 INI 文件（基准测试等隔离场景）。"""
+    path = os.environ.get("SALARY_SETTINGS_FILE")
+    if path:
+        return QSettings(path, QSettings.IniFormat)
+    return QSettings("Real-time Salary", "SalaryApp")  # 可替换为实际名称
+
+
 class SalaryCalculatorWidget(QWidget):
-    def __init__(self):
+    def __init__(self, settings=None):
         super().__init__()
 
         self.pages = QStackedWidget(self)
@@ -234,56 +388,95 @@ class SalaryCalculatorWidget(QWidget):
         layout.addWidget(self.pages)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.settings_page = SettingsPage()
-        self.result_page = ResultPage()
+        if settings is None:
+            settings = open_app_settings()
+        self.settings = settings
 
-        self.pages.addWidget(self.settings_page)
+        self.calendar = WorkdayCalendar(self.settings.value("holiday_file") or None)
+        # 设置页按需创建：已有配置时启动不必构建它，空闲回收时也可以释放
+        self.settings_page = None
+        self.result_page = ResultPage(self.calendar)
         self.pages.addWidget(self.result_page)
 
-        self.settings_page.save_btn.clicked.connect(self.on_save)
-        self.result_page.back_button.clicked.connect(
-            lambda: self.pages.setCurrentIndex(0)
-        )
+        self.result_page.back_button.clicked.connect(self.show_settings_page)
 
-        self.settings = QSettings("Real-time Salary", "SalaryApp")  # 可替换为实际名称
         self.try_load_settings()
 
-    def try_load_settings(self):
-        if (
+    def ensure_settings_page(self):
+        if self.settings_page is None:
+            self.settings_page = SettingsPage()
+            self.settings_page.save_btn.clicked.connect(self.on_save)
+            self.pages.insertWidget(0, self.settings_page)
+            self.fill_settings_page()
+        return self.settings_page
+
+    def show_settings_page(self):
+        self.pages.setCurrentWidget(self.ensure_settings_page())
+
+    def has_complete_settings(self):
+        auto_days = self.settings.value("auto_days", False, type=bool)
+        return (
             self.settings.contains("salary")
-            and self.settings.contains("days")
+            and (auto_days or self.settings.contains("days"))
             and self.settings.contains("start")
             and self.settings.contains("end")
-        ):
-            salary = float(self.settings.value("salary"))
-            days = int(self.settings.value("days"))
-            start = QTime.fromString(self.settings.value("start"), "HH:mm")
-            end = QTime.fromString(self.settings.value("end"), "HH:mm")
+        )
 
-            # 写入设置页（用于展示）
-            self.settings_page.salary_input.setText(str(salary))
+    def load_settings(self):
+        salary = float(self.settings.value("salary"))
+        days = int(self.settings.value("days", 0))
+        start = QTime.fromString(self.settings.value("start"), "HH:mm")
+        end = QTime.fromString(self.settings.value("end"), "HH:mm")
+        auto_days = self.settings.value("auto_days", False, type=bool)
+        return salary, days, start, end, auto_days
+
+    def fill_settings_page(self):
+        if not self.has_complete_settings():
+            return
+        salary, days, start, end, auto_days = self.load_settings()
+
+        # 写入设置页（用于展示）
+        self.settings_page.salary_input.setText(str(salary))
+        if days:
             self.settings_page.days_input.setText(str(days))
-            self.settings_page.start_time.setTime(start)
-            self.settings_page.end_time.setTime(end)
+        self.settings_page.auto_days_check.setChecked(auto_days)
+        self.settings_page.start_time.setTime(start)
+        self.settings_page.end_time.setTime(end)
 
+    def try_load_settings(self):
+        if self.has_complete_settings():
             # 应用设置并跳转页面
-            self.result_page.apply_settings(salary, days, start, end)
-            self.pages.setCurrentIndex(1)
+            self.result_page.apply_settings(*self.load_settings())
+            self.pages.setCurrentWidget(self.result_page)
         else:
-            self.pages.setCurrentIndex(0)
+            self.show_settings_page()
 
     def on_save(self):
         salary = float(self.settings_page.salary_input.text())
-        days = int(self.settings_page.days_input.text())
+        auto_days = self.settings_page.auto_days_check.isChecked()
+        days_text = self.settings_page.days_input.text()
+        days = int(days_text) if days_text or not auto_days else 0
         start = self.settings_page.start_time.time()
         end = self.settings_page.end_time.time()
 
         # 保存配置
         self.settings.setValue("salary", salary)
         self.settings.setValue("days", days)
+        self.settings.setValue("auto_days", auto_days)
         self.settings.setValue("start", start.toString("HH:mm"))
         self.settings.setValue("end", end.toString("HH:mm"))
 
         # 应用设置
-        self.result_page.apply_settings(salary, days, start, end)
-        self.pages.setCurrentIndex(1)
+        self.result_page.apply_settings(salary, days, start, end, auto_days)
+        self.pages.setCurrentWidget(self.result_page)
+
+    def release_caches(self):
+        # 设置页不在显示时整页释放，下次点击“修改设置”再重建
+        if (
+            self.settings_page is not None
+            and self.pages.currentWidget() is not self.settings_page
+        ):
+            self.pages.removeWidget(self.settings_page)
+            self.settings_page.deleteLater()
+            self.settings_page = None
+        self.result_page.sparkline.release_caches()
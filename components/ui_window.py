@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+import os
+import sys
+import time
+
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -7,41 +11,134 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import (
     Qt,
-    QTimer,
     QPoint,
-    QEvent,
     QRect,
+    QRectF,
     QPropertyAnimation,
     QEasingCurve,
+    Signal,
+)
+from PySide6.QtGui import (
+    QCursor,
+    QPainter,
+    QPainterPath,
+    QColor,
+    QLinearGradient,
+    QRegion,
 )
-from PySide6.QtGui import QCursor, QPainter, QBrush, QColor, QLinearGradient
+
+from components.metrics import METRICS
+from components.plugins import PluginHost
+from components.scheduler import HIGH, default_wheel
+from components.ui_layer import CachedLayer
+
+CORNER_RADIUS = 8
+
+# 没有合成器的平台：半透明窗口要么不可用，要么每帧都要软件混合
+_OPAQUE_PLATFORMS = ("offscreen", "minimal", "vnc", "linuxfb", "eglfs")
+
+
+def _is_remote_session():
+    if sys.platform == "win32":
+        import ctypes
+
+        SM_REMOTESESSION = 0x1000
+        return bool(ctypes.windll.user32.GetSystemMetrics(SM_REMOTESESSION))
+    if os.environ.get("SSH_CONNECTION"):
+        return True
+    # X11 转发 / 远程 X 服务器：DISPLAY 形如 host:10.0
+    display = os.environ.get("DISPLAY", "")
+    return bool(display.split(":", 1)[0]) and ":" in display
+
+
+def _x11_compositor_running():
+    """X11 下合成器会持有 _NET_WM_CM_S<屏幕号> 选择；无法判断时返回 None。"""
+    import ctypes
+    import ctypes.util
+
+    name = ctypes.util.find_library("X11")
+    if not name:
+        return None
+    try:
+        xlib = ctypes.CDLL(name)
+    except OSError:
+        return None
+    xlib.XOpenDisplay.restype = ctypes.c_void_p
+    xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+    xlib.XDefaultScreen.argtypes = [ctypes.c_void_p]
+    xlib.XInternAtom.restype = ctypes.c_ulong
+    xlib.XInternAtom.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
+    xlib.XGetSelectionOwner.restype = ctypes.c_ulong
+    xlib.XGetSelectionOwner.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+    xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+
+    display = xlib.XOpenDisplay(None)
+    if not display:
+        return None
+    try:
+        atom = xlib.XInternAtom(
+            display, f"_NET_WM_CM_S{xlib.XDefaultScreen(display)}".encode(), 0
+        )
+        return xlib.XGetSelectionOwner(display, atom) != 0
+    finally:
+        xlib.XCloseDisplay(display)
+
+
+def resolve_render_mode(mode="auto"):
+    """返回 "translucent" 或 "opaque"；auto 时在远程会话和无合成器的桌面上选 opaque。"""
+    if mode in ("translucent", "opaque"):
+        return mode
+    platform = QApplication.platformName()
+    if platform in _OPAQUE_PLATFORMS or _is_remote_session():
+        return "opaque"
+    if platform == "xcb" and _x11_compositor_running() is False:
+        return "opaque"
+    return "translucent"
 
 
 class AutoHideWindow(QWidget):
+    # 窗口对用户不可见（托盘隐藏或贴边收起）时为 True
+    concealedChanged = Signal(bool)
+
     def __init__(
         self,
         margin=5,
         snap_threshold=20,
         animation_duration=250,
         hide_delay=500,
+        poll_interval=200,
+        render_mode="auto",
+        window_flags=Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool,
     ):
         super().__init__()
 
-        # self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-        self.setMouseTracking(True)
-        self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setAttribute(Qt.WA_OpaquePaintEvent)
-        self.installEventFilter(self)
+        # 在原生窗口创建之前设定最终的窗口标志，避免之后改标志导致窗口重建
+        self.setWindowFlags(window_flags)
+        # 不开启鼠标跟踪、不给自己装事件过滤器：只有真正需要的事件类型
+        # （按住左键拖动、进入/离开、绘制）才会回调到 Python
+
+        # translucent：ARGB 后备存储 + 合成器混合，圆角抗锯齿
+        # opaque：不透明窗口，圆角由按尺寸缓存的窗口遮罩裁出
+        self.render_mode = resolve_render_mode(render_mode)
+        if self.render_mode == "opaque":
+            self.setAttribute(Qt.WA_OpaquePaintEvent)
+        else:
+            self.setAttribute(Qt.WA_TranslucentBackground)
+        self._background = CachedLayer(self.render_background)
+        self._mask_cache = {}
 
         self.auto_hide_margin = margin
         self.snap_threshold = snap_threshold
         self.animation_duration = animation_duration
         self.hide_delay = hide_delay
+        self.poll_interval = poll_interval
 
         self.dragging = False
         self.drag_position = QPoint()
+        self._pending_drag_pos = None
         self.hidden_edge = None
         self._is_hidden = False
+        self._concealed = False
         self._is_animating = False
 
         self.screen_geometry = QApplication.primaryScreen().availableGeometry()
@@ -75,14 +172,26 @@ class AutoHideWindow(QWidget):
         self._content_layout.setContentsMargins(0, 6, 0, 0)
         self._main_layout.addLayout(self._content_layout)
 
-        self.monitor_timer = QTimer(self)
+        # 插件宿主：由外部把共享 tick 接到 self.plugins.on_tick
+        self.plugins = PluginHost(parent=self)
+
+        # 鼠标轮询只在贴边收起时运行
+        wheel = default_wheel()
+        self.monitor_timer = wheel.timer("monitor", priority=HIGH, parent=self)
+        self.monitor_timer.setInterval(self.poll_interval)
         self.monitor_timer.timeout.connect(self.check_mouse_position)
-        self.monitor_timer.start(200)
 
-        self.leave_timer = QTimer(self)
-        self.leave_timer.setSingleShot(True)
+        self.leave_timer = wheel.timer(
+            "leave", priority=HIGH, single_shot=True, parent=self
+        )
         self.leave_timer.timeout.connect(self.auto_hide_window)
 
+        # 拖动合帧：首次移动立即落地，之后由该定时器节流为每帧最多一次
+        self._drag_timer = wheel.timer(
+            "drag", priority=HIGH, slack_ms=0, single_shot=True, parent=self
+        )
+        self._drag_timer.timeout.connect(self.on_drag_frame)
+
     # ---------- 公共接口 ----------
     def addWidget(self, widget):
         self._content_layout.addWidget(widget)
@@ -96,6 +205,51 @@ class AutoHideWindow(QWidget):
     def addTitleBarRightWidget(self, widget):
         self._right_buttons_layout.addWidget(widget)
 
+    # ---------- 状态持久化 ----------
+    def save_state(self, settings):
+        # 动画进行中时保存动画终点，而不是中间帧
+        if self._is_animating:
+            geometry = self.anim.endValue()
+        else:
+            geometry = self.geometry()
+        settings.setValue("window/geometry", geometry)
+        settings.setValue("window/hidden_edge", self.hidden_edge or "")
+        settings.setValue("window/hidden", self._is_hidden)
+
+    def restore_state(self, settings):
+        """在首次 show() 之前调用；恢复成功返回 True，否则由调用方决定默认位置。"""
+        if not settings.contains("window/geometry"):
+            return False
+        geometry = settings.value("window/geometry")
+        if not isinstance(geometry, QRect) or not geometry.isValid():
+            return False
+
+        # 尺寸由界面布局决定，只恢复位置；屏幕变化后位置已不可见则放弃恢复
+        rect = QRect(geometry.topLeft(), self.size())
+        if not self.screen_geometry.intersects(rect):
+            return False
+        self.move(rect.topLeft())
+        self.update_hidden_edge()
+
+        hidden = settings.value("window/hidden", False, type=bool)
+        if hidden:
+            if self.hidden_edge != (settings.value("window/hidden_edge") or None):
+                return False
+            self._is_hidden = True
+            self.monitor_timer.start()
+        return True
+
+    def release_caches(self):
+        # 背景图层和遮罩都可按需重建；当前已应用的遮罩由窗口系统持有
+        self._background.invalidate()
+        self._mask_cache.clear()
+
+    def addPlugin(self, plugin):
+        widget = plugin.create_widget()
+        if widget is not None:
+            self.addTitleBarLeftWidget(widget)
+        self.plugins.register(plugin)
+
     # ---------- 拖动 ----------
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -106,14 +260,43 @@ class AutoHideWindow(QWidget):
 
     def mouseMoveEvent(self, event):
         if self.dragging and event.buttons() & Qt.LeftButton:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
-            self.snap_to_edges()
+            # 只记录目标位置，每帧最多真正移动一次窗口
+            self._pending_drag_pos = (
+                event.globalPosition().toPoint() - self.drag_position
+            )
+            # 首次移动立即落地，之后一帧之内的移动合并到帧末
+            if not self._drag_timer.isActive():
+                self.flush_drag()
+                self._drag_timer.start(self.frame_interval())
 
     def mouseReleaseEvent(self, event):
+        self._drag_timer.stop()
+        self.flush_drag()
         self.dragging = False
 
-    def snap_to_edges(self):
-        pos = self.pos()
+    def frame_interval(self):
+        screen = self.screen() or QApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        if rate <= 0:
+            rate = 60
+        return max(1, int(1000 / rate))
+
+    def on_drag_frame(self):
+        # 本帧内有新的目标位置才移动，并继续节流到下一帧
+        if self._pending_drag_pos is not None:
+            self.flush_drag()
+            self._drag_timer.start(self.frame_interval())
+
+    def flush_drag(self):
+        if self._pending_drag_pos is None:
+            return
+        target = self.snapped_position(self._pending_drag_pos)
+        self._pending_drag_pos = None
+        if target != self.pos():
+            self.move(target)
+            self.update_hidden_edge()
+
+    def snapped_position(self, pos):
         screen = self.screen_geometry
         new_x, new_y = pos.x(), pos.y()
 
@@ -124,12 +307,11 @@ class AutoHideWindow(QWidget):
         if abs(pos.y()) < self.snap_threshold:
             new_y = 0
 
-        self.move(new_x, new_y)
+        return QPoint(new_x, new_y)
 
     # ---------- 自动隐藏 ----------
-    def moveEvent(self, event):
-        self.update_hidden_edge()
-
+    # 不重写 moveEvent：窗口只由拖动、吸附和滑动动画移动，
+    # 贴边状态在拖动落地和显示时更新即可，动画的每一帧无需回调 Python
     def update_hidden_edge(self):
         pos = self.pos()
         screen = self.screen_geometry
@@ -159,6 +341,8 @@ class AutoHideWindow(QWidget):
 
         self.animate_geometry(start_rect, end_rect)
         self._is_hidden = True
+        self.monitor_timer.start()
+        self.update_concealed()
 
     def show_full_window(self):
         if not self.hidden_edge or not self._is_hidden or self._is_animating:
@@ -176,6 +360,24 @@ class AutoHideWindow(QWidget):
 
         self.animate_geometry(start_rect, end_rect)
         self._is_hidden = False
+        self.monitor_timer.stop()
+        self.update_concealed()
+
+    def update_concealed(self):
+        concealed = self._is_hidden or not self.isVisible()
+        if concealed != self._concealed:
+            self._concealed = concealed
+            self.concealedChanged.emit(concealed)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._is_hidden:
+            self.update_hidden_edge()
+        self.update_concealed()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_concealed()
 
     def animate_geometry(self, start_rect, end_rect):
         if start_rect == end_rect:
@@ -187,8 +389,19 @@ class AutoHideWindow(QWidget):
         self.anim.setEndValue(end_rect)
         self.anim.setEasingCurve(QEasingCurve.OutQuad)
         self.anim.finished.connect(self.on_animation_finished)
+        if METRICS.enabled:
+            self._last_frame_time = None
+            self.anim.valueChanged.connect(self._record_animation_frame)
         self.anim.start()
 
+    def _record_animation_frame(self, value):
+        now = time.perf_counter()
+        if self._last_frame_time is not None:
+            METRICS.observe(
+                "salary_animation_frame_interval_seconds", now - self._last_frame_time
+            )
+        self._last_frame_time = now
+
     def on_animation_finished(self):
         self._is_animating = False
 
@@ -196,7 +409,7 @@ class AutoHideWindow(QWidget):
         if not self.hidden_edge or not self._is_hidden or self._is_animating:
             return
 
-        cursor = QCursor.pos()
+        cursor = self.cursor_pos()
         screen = self.screen_geometry
 
         if self.hidden_edge == "left" and cursor.x() <= self.auto_hide_margin:
@@ -209,6 +422,10 @@ class AutoHideWindow(QWidget):
         elif self.hidden_edge == "top" and cursor.y() <= self.auto_hide_margin:
             self.show_full_window()
 
+    def cursor_pos(self):
+        # 单独成方法，便于回放输入轨迹时替换光标来源
+        return QCursor.pos()
+
     def enterEvent(self, event):
         self.leave_timer.stop()
 
@@ -216,27 +433,50 @@ class AutoHideWindow(QWidget):
         if self.hidden_edge and not self._is_hidden:
             self.leave_timer.start(self.hide_delay)
 
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.Enter:
-            self.leave_timer.stop()
-        elif event.type() == QEvent.Leave:
-            if self.hidden_edge and not self._is_hidden:
-                self.leave_timer.start(self.hide_delay)
-        return super().eventFilter(obj, event)
-
+    @METRICS.timed(
+        "salary_window_paint_seconds", "Duration of AutoHideWindow.paintEvent"
+    )
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(
+            0, 0, self._background.pixmap(self.size(), self.devicePixelRatioF())
+        )
+        painter.end()
 
+    def render_background(self, painter, size):
         # 创建渐变背景
-        gradient = QLinearGradient(0, 0, self.width(), self.height())
+        gradient = QLinearGradient(0, 0, size.width(), size.height())
         gradient.setColorAt(0, QColor("#eaf0ff"))
         gradient.setColorAt(1, QColor("#f6faff"))
 
+        if self.render_mode == "opaque":
+            # 圆角交给窗口遮罩，这里整块填充
+            painter.fillRect(0, 0, size.width(), size.height(), gradient)
+            return
+
         # 设置渐变作为背景填充
+        painter.setRenderHint(QPainter.Antialiasing)
         painter.setBrush(gradient)
         painter.setPen(Qt.NoPen)
 
         # 绘制带圆角的矩形
-        painter.drawRoundedRect(self.rect(), 8, 8)  # 圆角半径为20px
-        painter.end()
+        painter.drawRoundedRect(
+            QRectF(0, 0, size.width(), size.height()), CORNER_RADIUS, CORNER_RADIUS
+        )
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.render_mode == "opaque":
+            self.setMask(self.rounded_mask(self.width(), self.height()))
+
+    def rounded_mask(self, width, height):
+        key = (width, height)
+        region = self._mask_cache.get(key)
+        if region is None:
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(0, 0, width, height), CORNER_RADIUS, CORNER_RADIUS)
+            region = QRegion(path.toFillPolygon().toPolygon())
+            if len(self._mask_cache) >= 4:
+                self._mask_cache.clear()
+            self._mask_cache[key] = region
+        return region
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""工作日历：法定节假日 + 调休上班日。
+
+每年预先计算一个按年内序号排列的工作日标记和前缀和，
+之后任意月份的工作日数、月初至今的工作日数都是 O(1) 查表。
+节假日表格式见 resources/holidays.json；表中没有的年份按周一至周五计算。
+"""
+import calendar
+import datetime
+import json
+import os
+import sys
+from array import array
+
+
+def default_holiday_path():
+    # PyInstaller 打包后资源位于 sys._MEIPASS
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.dirname(__file__)))
+    return os.path.join(base, "resources", "holidays.json")
+
+
+class YearTable:
+    __slots__ = ("year", "workday", "prefix", "month_start")
+
+    def __init__(self, year, holidays=(), workdays=()):
+        self.year = year
+        first = datetime.date(year, 1, 1)
+        length = 366 if calendar.isleap(year) else 365
+
+        # 周一至周五为工作日，再叠加节假日和调休
+        weekday = first.weekday()
+        flags = bytearray((weekday + i) % 7 < 5 for i in range(length))
+        for day in holidays:
+            flags[day.toordinal() - first.toordinal()] = 0
+        for day in workdays:
+            flags[day.toordinal() - first.toordinal()] = 1
+        self.workday = bytes(flags)
+
+        prefix = array("H", [0]) * (length + 1)
+        for i, flag in enumerate(flags):
+            prefix[i + 1] = prefix[i] + flag
+        self.prefix = prefix
+
+        # month_start[m] 为 m 月 1 日的年内序号（m = 1..12），month_start[13] = length
+        starts = array("H", [0, 0])
+        for month in range(1, 13):
+            starts.append(starts[-1] + calendar.monthrange(year, month)[1])
+        self.month_start = starts
+
+
+class WorkdayCalendar:
+    def __init__(self, path=None):
+        self._tables = {}
+        self._overrides = {}
+        path = path or default_holiday_path()
+        if os.path.exists(path):
+            self.load(path)
+
+    def load(self, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for year_text, entry in data.items():
+            year = int(year_text)
+            parse = lambda text: datetime.date(year, int(text[:2]), int(text[3:5]))
+            self._overrides[year] = (
+                [parse(d) for d in entry.get("holidays", ())],
+                [parse(d) for d in entry.get("workdays", ())],
+            )
+            self._tables.pop(year, None)
+
+    def has_year(self, year):
+        return year in self._overrides
+
+    def table(self, year):
+        table = self._tables.get(year)
+        if table is None:
+            holidays, workdays = self._overrides.get(year, ((), ()))
+            table = self._tables[year] = YearTable(year, holidays, workdays)
+        return table
+
+    def _index(self, day):
+        return day.toordinal() - datetime.date(day.year, 1, 1).toordinal()
+
+    def is_workday(self, day):
+        return bool(self.table(day.year).workday[self._index(day)])
+
+    def workdays_in_month(self, year, month):
+        table = self.table(year)
+        return table.prefix[table.month_start[month + 1]] - table.prefix[
+            table.month_start[month]
+        ]
+
+    def workdays_in_year(self, year):
+        return self.table(year).prefix[-1]
+
+    def workdays_before(self, day):
+        """本月 1 日到 day 前一天之间的工作日数（不含 day）。"""
+        table = self.table(day.year)
+        return table.prefix[self._index(day)] - table.prefix[table.month_start[day.month]]
@@ -1,25 +1,78 @@
 # -*- coding: utf-8 -*-
+import logging
+import os
 import sys
 from PySide6.QtWidgets import QApplication, QLabel, QSystemTrayIcon, QMenu
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon, QAction, QGuiApplication
 from components.ui_button import FluentCloseButton
-from components.ui_widget import SalaryCalculatorWidget
+from components.ui_widget import SalaryCalculatorWidget, open_app_settings
 from components.ui_window import AutoHideWindow
+from components.scheduler import HIGH, PowerPolicy, default_wheel
+from components.live_feed import LiveFeedWriter
+from components.idle_trim import IdleTrimmer
+from components.input_trace import TraceRecorder
+from components.ui_metrics import (
+    MetricsOverlay,
+    metrics_overlay_requested,
+    start_metrics_export,
+)
 from resources import resource
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
     # 创建窗口
-    window = AutoHideWindow()
-    window.resize(320, 220)
-    window.addWidget(SalaryCalculatorWidget())
+    # 渲染模式：auto / translucent / opaque（远程桌面、无合成器的 X11 下 auto 会选 opaque）
+    app_settings = open_app_settings()
+    window = AutoHideWindow(render_mode=app_settings.value("render_mode", "auto"))
+    window.resize(320, 264)
+    salary_widget = SalaryCalculatorWidget(app_settings)
+    window.addWidget(salary_widget)
+
+    # 电源策略：窗口不可见时暂停界面刷新，电池供电时拉长低优先级任务
+    power_policy = PowerPolicy(default_wheel(), parent=app)
+    window.concealedChanged.connect(power_policy.set_hidden)
+
+    # 窗口隐藏超过 idle_trim_minutes 分钟后回收可重建的缓存（0 表示关闭）
+    idle_trimmer = IdleTrimmer(
+        [window, salary_widget],
+        float(app_settings.value("idle_trim_minutes", 10)),
+        parent=app,
+    )
+    window.concealedChanged.connect(idle_trimmer.set_concealed)
+
+    # 共享内存实时数据，供其他进程读取（见 components/live_feed.py）
+    live_feed = None
+    if app_settings.value("live_feed", True, type=bool):
+        try:
+            live_feed = LiveFeedWriter()
+        except OSError as exc:
+            # 路径被占用（符号链接、他人的目录等）时不共享数据，但照常启动
+            logging.warning("实时数据共享已关闭：%s", exc)
+    if live_feed is not None:
+        # 单独的发布定时器只计算快照、不碰控件；界面 tick 仍是低优先级，
+        # 窗口隐藏时照常暂停，而外部读者依旧每秒拿到数据
+        feed_timer = default_wheel().timer("feed", priority=HIGH, slack_ms=100, parent=app)
+        feed_timer.timeout.connect(
+            lambda: live_feed.publish_tick(salary_widget.result_page.compute_tick())
+        )
+        feed_timer.start(1000)
+        app.aboutToQuit.connect(feed_timer.stop)
+        app.aboutToQuit.connect(live_feed.close)
+
+    # 插件订阅结果页的 tick；退出时丢弃排队任务，不等待在途插件
+    salary_widget.result_page.ticked.connect(window.plugins.on_tick)
+    app.aboutToQuit.connect(window.plugins.shutdown)
 
     # 创建关闭按钮，绑定 window 关闭
     close_btn = FluentCloseButton(target_window=window)
     window.addTitleBarRightWidget(close_btn)
 
+    # 调试用：SALARY_METRICS=1 开启指标导出，SALARY_METRICS_OVERLAY=1 显示浮层
+    metrics_exporter = start_metrics_export(app)
+    if metrics_overlay_requested():
+        window.addTitleBarLeftWidget(MetricsOverlay())
+
     # 创建托盘图标
     tray_icon = QSystemTrayIcon(QIcon(":/app/icon.png"), parent=app)
     tray_icon.setToolTip("Salary Calculator")
@@ -60,28 +113,34 @@ if __name__ == "__main__":
     # 显示托盘图标
     tray_icon.show()
 
-    # 设置窗口不显示在任务栏
-    window.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
-
-    # 获取主屏幕的尺寸，计算右下角位置
-    screen = QGuiApplication.primaryScreen()
-    screen_geometry = screen.availableGeometry()
+    # 窗口标志（无边框、置顶、不显示在任务栏）已在 AutoHideWindow 构造时设定
+    # 恢复上次退出时的位置和贴边收起状态；没有记录时放在右下角
+    if not window.restore_state(app_settings):
+        # 获取主屏幕的尺寸，计算右下角位置
+        screen = QGuiApplication.primaryScreen()
+        screen_geometry = screen.availableGeometry()
 
-    # 设置距离右侧和底部的固定距离（单位：像素）
-    margin_right = 10  # 距离右侧的距离
-    margin_bottom = 80  # 距离底部的距离
+        # 设置距离右侧和底部的固定距离（单位：像素）
+        margin_right = 10  # 距离右侧的距离
+        margin_bottom = 80  # 距离底部的距离
 
-    # 计算窗口的位置
-    x = (
-        screen_geometry.right() - window.width() - margin_right
-    )  # 右边缘 - 窗口宽度 - 固定距离
-    y = (
-        screen_geometry.bottom() - window.height() - margin_bottom
-    )  # 底边缘 - 窗口高度 - 固定距离
-    window.move(x, y)  # 设置窗口位置
+        # 计算窗口的位置
+        x = (
+            screen_geometry.right() - window.width() - margin_right
+        )  # 右边缘 - 窗口宽度 - 固定距离
+        y = (
+            screen_geometry.bottom() - window.height() - margin_bottom
+        )  # 底边缘 - 窗口高度 - 固定距离
+        window.move(x, y)  # 设置窗口位置
+    app.aboutToQuit.connect(lambda: window.save_state(app_settings))
 
     # 初始时显示窗口
     window.show()
 
+    # 调试用：SALARY_TRACE_FILE=路径 录制光标 / 进入 / 离开轨迹
+    if os.environ.get("SALARY_TRACE_FILE"):
+        trace_recorder = TraceRecorder(window, os.environ["SALARY_TRACE_FILE"], parent=app)
+        app.aboutToQuit.connect(trace_recorder.close)
+
     # 退出应用时销毁托盘图标
     sys.exit(app.exec())
@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[('resources/holidays.json', 'resources')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
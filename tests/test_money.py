@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+
+from components.money import DailyAccrual, format_cents, to_cents
+from components.workday_calendar import WorkdayCalendar
+
+SALARIES = ("10000", "8888.88", "12345.67", "7000.01", "33333.33")
+TOTAL_SECONDS = 9 * 3600
+
+
+@pytest.mark.parametrize(
+    "value, cents",
+    [
+        ("10000", 1000000),
+        ("0.005", 1),
+        ("0.004", 0),
+        ("8888.885", 888889),
+        (0.1 + 0.2, 30),
+        (12345.67, 1234567),
+    ],
+)
+def test_to_cents_rounds_half_up(value, cents):
+    assert to_cents(value) == cents
+
+
+@pytest.mark.parametrize("cents, text", [(0, "0.00"), (5, "0.05"), (123456, "1234.56")])
+def test_format_cents(cents, text):
+    assert format_cents(cents) == text
+
+
+def test_intraday_accrual_is_monotonic_and_ends_on_day_total():
+    accrual = DailyAccrual(to_cents("12345.67"), 21, 7, TOTAL_SECONDS)
+    assert accrual.earned_cents(0) == 0
+    previous = 0
+    for seconds in range(0, TOTAL_SECONDS + 1):
+        earned = accrual.earned_cents(seconds)
+        assert previous <= earned <= accrual.day_cents
+        previous = earned
+    assert accrual.earned_cents(TOTAL_SECONDS) == accrual.day_cents
+
+
+def test_rest_day_earns_nothing():
+    accrual = DailyAccrual(to_cents("10000"), 21, 5, TOTAL_SECONDS, is_workday=False)
+    assert accrual.day_cents == 0
+    assert accrual.earned_cents(TOTAL_SECONDS) == 0
+
+
+@pytest.mark.parametrize("salary", SALARIES)
+def test_simulated_year_is_exact(salary):
+    calendar = WorkdayCalendar()
+    month_cents = to_cents(salary)
+    day = datetime.date(2026, 1, 1)
+    while day.year == 2026:
+        month = day.month
+        days = calendar.workdays_in_month(2026, month)
+        # 每个工作日分到的金额只差不到 1 分
+        low, high = month_cents // days, -(-month_cents // days)
+        month_total = 0
+        while day.month == month:
+            workday = calendar.is_workday(day)
+            accrual = DailyAccrual(
+                month_cents, days, calendar.workdays_before(day), TOTAL_SECONDS, workday
+            )
+            assert accrual.month_before_cents == month_total
+            if workday:
+                assert low <= accrual.day_cents <= high
+            month_total += accrual.earned_cents(TOTAL_SECONDS)
+            day += datetime.timedelta(days=1)
+        assert month_total == month_cents
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from components.plugins import PluginHost, TickPlugin
+from components.scheduler import default_wheel
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class BlockingPlugin(TickPlugin):
+    name = "my-plugin"
+    budget_ms = 20
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def compute(self, tick):
+        self.release.wait()
+
+
+def test_watchdog_reports_hung_plugin_while_hidden(qapp):
+    wheel = default_wheel()
+    wheel.set_policy("hidden")
+    host = PluginHost()
+    plugin = BlockingPlugin()
+    host.register(plugin)
+    overruns = []
+    host.overrun.connect(lambda name, elapsed: overruns.append(name))
+    try:
+        # 只来一次 tick：隐藏时界面 tick 暂停，看门狗必须自己醒来
+        host.on_tick({})
+        deadline = time.monotonic() + 2
+        while not overruns and time.monotonic() < deadline:
+            qapp.processEvents()
+        assert overruns == ["my-plugin"]
+        assert host._slots[0].metric == "salary_plugin_my_plugin_seconds"
+    finally:
+        plugin.release.set()
+        host.shutdown()
+        host.deleteLater()
+        wheel.set_policy("normal")
+
+
+def test_exit_does_not_wait_for_hung_plugin():
+    # 托盘“退出”后解释器不能被卡住的插件线程拖住
+    script = """
+import threading
+from PySide6.QtCore import QCoreApplication
+from components.plugins import PluginHost, TickPlugin
+
+class Stuck(TickPlugin):
+    def compute(self, tick):
+        threading.Event().wait()
+
+app = QCoreApplication([])
+host = PluginHost()
+host.register(Stuck())
+host.on_tick({})
+host.shutdown()
+"""
+    subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, timeout=10, check=True)
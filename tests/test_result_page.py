@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QTime
+
+from components import ui_widget
+from components.money import to_cents
+from components.ui_widget import ResultPage
+
+REAL_DATE = datetime.date
+
+
+class FakeDate(REAL_DATE):
+    current = REAL_DATE(2026, 1, 1)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+class FakeTime(QTime):
+    current = QTime(0, 0)
+
+    @classmethod
+    def currentTime(cls):
+        return cls.current
+
+
+WORK_START = QTime(9, 0)
+WORK_END = QTime(18, 0)
+
+
+def _cents(text):
+    return int(text.replace(".", ""))
+
+
+def simulate_year(qapp, monkeypatch, salary, days, auto_days):
+    """逐日在上班和下班时刻驱动 ResultPage.update_ui。
+
+    返回 [(日期, 时刻, 当日已赚, 本月累计)]，每天两条：上班时刻与下班时刻。
+    """
+    monkeypatch.setattr(ui_widget.datetime, "date", FakeDate)
+    monkeypatch.setattr(ui_widget, "QTime", FakeTime)
+    page = ResultPage()
+    page.resize(300, 260)
+    page.apply_settings(salary, days, WORK_START, WORK_END, auto_days)
+
+    rows = []
+    day = REAL_DATE(2026, 1, 1)
+    while day.year == 2026:
+        FakeDate.current = FakeDate(day.year, day.month, day.day)
+        for moment in (WORK_START, WORK_END):
+            FakeTime.current = moment
+            page.update_ui()
+            amount = _cents(page.amount_label.text().lstrip("￥"))
+            month_text = page.month_label.text().split("￥")[1].split(" ")[0]
+            rows.append((day, moment, amount, _cents(month_text)))
+        day += datetime.timedelta(days=1)
+    page.deleteLater()
+    return rows
+
+
+def _by_month(rows):
+    months = {}
+    for row in rows:
+        months.setdefault(row[0].month, []).append(row)
+    return months.values()
+
+
+@pytest.mark.parametrize("salary", [10000.0, 12345.67, 7000.01])
+def test_auto_days_month_totals_are_exact(qapp, monkeypatch, salary):
+    month_cents = to_cents(salary)
+    for month in _by_month(simulate_year(qapp, monkeypatch, salary, 0, True)):
+        running = 0
+        for day, moment, amount, month_total in month:
+            if moment == WORK_START:
+                # 上班时刻当日已赚为 0，月累计等于此前各日之和
+                assert amount == 0, day
+                assert month_total == running, day
+            else:
+                running += amount
+                assert month_total == running, day
+        assert month[-1][3] == month_cents
+
+
+@pytest.mark.parametrize("salary", [10000.0, 8888.88])
+def test_manual_days_month_total_never_goes_backwards(qapp, monkeypatch, salary):
+    month_cents = to_cents(salary)
+    for month in _by_month(simulate_year(qapp, monkeypatch, salary, 22, False)):
+        previous = 0
+        for day, moment, amount, month_total in month:
+            # 每天早上不能回落到前一天之下，也不能超过月工资
+            assert previous <= month_total <= month_cents, (day, moment)
+            previous = month_total
+        # 手动模式每天都计薪：第 22 天下班时达到月工资，之后保持不变
+        assert month[42][3] < month_cents
+        assert month[43][3] == month_cents
+        assert month[-1][3] == month_cents
+
+
+def test_compute_tick_defers_sparkline_rebuild_to_update_ui(qapp, monkeypatch):
+    monkeypatch.setattr(ui_widget.datetime, "date", FakeDate)
+    monkeypatch.setattr(ui_widget, "QTime", FakeTime)
+    FakeDate.current = FakeDate(2026, 3, 2)
+    FakeTime.current = QTime(12, 0)
+    page = ResultPage()
+    page.apply_settings(10000.0, 22, WORK_START, WORK_END)
+    page.update_ui()
+    resets = []
+    reset_day = page.sparkline.reset_day
+    page.sparkline.reset_day = lambda: (resets.append(1), reset_day())
+
+    # 跨天后由实时数据定时器先取快照：金额换到新的一天，曲线保持不动
+    FakeDate.current = FakeDate(2026, 3, 3)
+    tick = page.compute_tick()
+    assert tick["month_earned_cents"] > to_cents(10000.0) // 22
+    assert resets == []
+
+    page.update_ui()
+    assert resets == [1]
+    page.deleteLater()
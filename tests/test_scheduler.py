@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+pytest.importorskip("PySide6")
+
+from components import scheduler
+from components.scheduler import (
+    BATTERY_STRETCH,
+    COALESCE_MS,
+    HIGH,
+    LOW,
+    NORMAL,
+    TimerWheel,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(scheduler, "_now_ms", fake)
+    return fake
+
+
+@pytest.fixture
+def wheel(qapp, clock):
+    wheel = TimerWheel()
+    yield wheel
+    wheel._timer.stop()
+    wheel.deleteLater()
+
+
+def make_timer(wheel, name, priority=NORMAL, **kwargs):
+    timer = wheel.timer(name, priority=priority, **kwargs)
+    fired = []
+    timer.timeout.connect(lambda: fired.append(name))
+    return timer, fired
+
+
+def test_close_deadlines_coalesce_into_one_wakeup(wheel, clock):
+    first, fired_first = make_timer(wheel, "first")
+    near, fired_near = make_timer(wheel, "near")
+    far, fired_far = make_timer(wheel, "far")
+    first.start(100)
+    near.start(100 + COALESCE_MS - 5)
+    far.start(100 + COALESCE_MS + 5)
+
+    clock.now = 100
+    wheel._wake()
+    # COALESCE_MS 之内的截止时间随同一次唤醒执行，之外的留到下次
+    assert fired_first == ["first"]
+    assert fired_near == ["near"]
+    assert fired_far == []
+
+
+def test_hidden_policy_pauses_only_low_timers(wheel, clock):
+    tick, fired_tick = make_timer(wheel, "tick", priority=LOW)
+    monitor, fired_monitor = make_timer(wheel, "monitor", priority=HIGH)
+    tick.start(1000)
+    monitor.start(1000)
+    wheel.set_policy("hidden")
+
+    clock.now = 5000
+    wheel._wake()
+    assert fired_tick == []
+    assert fired_monitor == ["monitor"]
+
+    # 恢复可见后，暂停期间到期的 LOW 任务只补一次
+    wheel.set_policy("normal")
+    wheel._wake()
+    assert fired_tick == ["tick"]
+
+
+def test_battery_stretches_normal_and_low_but_not_high(wheel, clock):
+    wheel.set_policy("battery")
+    export, _ = make_timer(wheel, "export", priority=NORMAL)
+    tick, _ = make_timer(wheel, "tick", priority=LOW)
+    monitor, _ = make_timer(wheel, "monitor", priority=HIGH)
+    for timer in (export, tick, monitor):
+        timer.start(1000)
+
+    assert export.deadline == 1000 * BATTERY_STRETCH
+    assert tick.deadline == 1000 * BATTERY_STRETCH
+    assert monitor.deadline == 1000
+    assert wheel._effective_slack(export) == export.slack() * BATTERY_STRETCH
+
+
+def test_late_wakeup_keeps_phase(wheel, clock):
+    tick, fired = make_timer(wheel, "tick")
+    tick.start(1000)
+
+    # 晚醒 300ms：下一次仍落在原来的相位上，不会整体后移
+    clock.now = 1300
+    wheel._wake()
+    assert fired == ["tick"]
+    assert tick.deadline == 2000
+
+    # 落后超过一个周期：从现在重新计时，不补发错过的几次
+    clock.now = 4500
+    wheel._wake()
+    assert fired == ["tick", "tick"]
+    assert tick.deadline == 5500
+
+
+def test_single_shot_timer_stops_after_firing(wheel, clock):
+    leave, fired = make_timer(wheel, "leave", single_shot=True)
+    leave.start(500)
+
+    clock.now = 500
+    wheel._wake()
+    clock.now = 2000
+    wheel._wake()
+    assert fired == ["leave"]
+    assert not leave.isActive()
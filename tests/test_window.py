@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+pytest.importorskip("PySide6")
+
+from components import scheduler
+from components.scheduler import PowerPolicy, default_wheel
+from components.ui_window import AutoHideWindow
+
+
+def test_hide_then_show_restores_normal_policy(qapp, monkeypatch):
+    monkeypatch.setattr(scheduler, "on_battery", lambda: False)
+    wheel = default_wheel()
+    window = AutoHideWindow()
+    policy = PowerPolicy(wheel)
+    window.concealedChanged.connect(policy.set_hidden)
+
+    window.show()
+    qapp.processEvents()
+    assert wheel.policy() == "normal"
+
+    # 关闭按钮只调用 hide()，之后通过托盘再次 show()
+    window.hide()
+    qapp.processEvents()
+    assert wheel.policy() == "hidden"
+
+    window.show()
+    qapp.processEvents()
+    assert wheel.policy() == "normal"
+
+    window.close()
+    window.deleteLater()
+    policy.deleteLater()